@@ -9,98 +9,54 @@ linting, validation, and secrets scanning.
 import sys
 from pathlib import Path
 
-# Add the yamlguard package to the path
-sys.path.insert(0, str(Path(__file__).parent))
-
 from yamlguard import YAMLGuard, Config
 from yamlguard.reporters import StylishReporter
 
 
-def demo_linting():
+def demo_linting(yamlguard: YAMLGuard, reporter: StylishReporter):
     """Demonstrate YAML linting functionality."""
     print("🔍 YAMLGuard Linting Demo")
     print("=" * 50)
     
-    # Create configuration
-    config = Config()
-    config.indent.step = 2
-    config.cosmetics.enabled = True
-    
-    # Initialize YAMLGuard
-    yamlguard = YAMLGuard(config=config)
-    
     # Lint the example file
     results = yamlguard.lint_files([Path("example.yaml")])
     
-    # Create reporter
-    reporter = StylishReporter(color=True, verbose=True)
-    
     # Generate report
     report = reporter.report(results)
     print(report)
 
 
-def demo_kubernetes_validation():
+def demo_kubernetes_validation(yamlguard: YAMLGuard, reporter: StylishReporter):
     """Demonstrate Kubernetes validation functionality."""
     print("\n🚀 Kubernetes Validation Demo")
     print("=" * 50)
     
-    # Create configuration
-    config = Config()
-    config.kubernetes.enabled = True
-    config.kubernetes.version = "1.30"
-    config.kubernetes.strict = False
-    
-    # Initialize YAMLGuard
-    yamlguard = YAMLGuard(config=config)
-    
     # Validate the example file
     results = yamlguard.kube_validate_files([Path("example.yaml")])
     
-    # Create reporter
-    reporter = StylishReporter(color=True, verbose=True)
-    
     # Generate report
     report = reporter.report(results)
     print(report)
 
 
-def demo_secrets_scanning():
+def demo_secrets_scanning(yamlguard: YAMLGuard, reporter: StylishReporter):
     """Demonstrate secrets scanning functionality."""
     print("\n🔐 Secrets Scanning Demo")
     print("=" * 50)
     
-    # Create configuration
-    config = Config()
-    config.secrets.enabled = True
-    config.secrets.entropy_threshold = 4.0  # Lower threshold for demo
-    
-    # Initialize YAMLGuard
-    yamlguard = YAMLGuard(config=config)
-    
     # Scan the example file
     results = yamlguard.scan_secrets_files([Path("example.yaml")])
     
-    # Create reporter
-    reporter = StylishReporter(color=True, verbose=True)
-    
     # Generate report
     report = reporter.report(results)
     print(report)
 
 
-def demo_auto_fix():
+def demo_auto_fix(yamlguard: YAMLGuard):
     """Demonstrate auto-fix functionality."""
     print("\n🔧 Auto-fix Demo")
     print("=" * 50)
     
-    # Create configuration
-    config = Config()
-    config.indent.step = 2
-    
-    # Initialize YAMLGuard
-    yamlguard = YAMLGuard(config=config)
-    
     # Fix the example file
     results = yamlguard.fix_files([Path("example.yaml")], in_place=False)
     
@@ -120,18 +76,32 @@ def main():
     print("🎯 YAMLGuard Comprehensive Demo")
     print("=" * 60)
     
+    # One configuration covering every demo, so a single YAMLGuard and
+    # reporter (with their compiled patterns and caches) serve all of them
+    config = Config()
+    config.indent.step = 2
+    config.cosmetics.enabled = True
+    config.kubernetes.enabled = True
+    config.kubernetes.version = "1.30"
+    config.kubernetes.strict = False
+    config.secrets.enabled = True
+    config.secrets.entropy_threshold = 4.0  # Lower threshold for demo
+    
+    yamlguard = YAMLGuard(config=config)
+    reporter = StylishReporter(color=True, verbose=True)
+    
     try:
         # Run linting demo
-        demo_linting()
+        demo_linting(yamlguard, reporter)
         
         # Run Kubernetes validation demo
-        demo_kubernetes_validation()
+        demo_kubernetes_validation(yamlguard, reporter)
         
         # Run secrets scanning demo
-        demo_secrets_scanning()
+        demo_secrets_scanning(yamlguard, reporter)
         
         # Run auto-fix demo
-        demo_auto_fix()
+        demo_auto_fix(yamlguard)
         
         print("\n✅ All demos completed successfully!")
         
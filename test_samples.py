@@ -9,187 +9,158 @@ in the samples/ directory.
 import sys
 from pathlib import Path
 
-# Add the yamlguard package to the path
-sys.path.insert(0, str(Path(__file__).parent))
-
 from yamlguard import YAMLGuard, Config
 from yamlguard.reporters import StylishReporter
 
+# Sample files live next to this script, independent of the working directory
+SAMPLES_DIR = Path(__file__).parent / "samples"
+
 
-def test_indentation_samples():
+def test_indentation_samples(yamlguard: YAMLGuard, reporter: StylishReporter):
     """Test indentation samples."""
     print("🔍 Testing Indentation Samples")
     print("=" * 50)
     
-    config = Config()
-    config.indent.step = 2
-    config.cosmetics.enabled = True
-    
-    yamlguard = YAMLGuard(config=config)
-    reporter = StylishReporter(color=True, verbose=True)
-    
     # Test good indentation
     print("\n📄 Testing good indentation...")
-    results = yamlguard.lint_files([Path("samples/indentation/good.yaml")])
+    results = yamlguard.lint_files([SAMPLES_DIR / "indentation/good.yaml"])
     report = reporter.report(results)
     print(report)
     
     # Test bad indentation
     print("\n📄 Testing bad indentation...")
-    results = yamlguard.lint_files([Path("samples/indentation/bad_indentation.yaml")])
+    results = yamlguard.lint_files([SAMPLES_DIR / "indentation/bad_indentation.yaml"])
     report = reporter.report(results)
     print(report)
     
     # Test mixed tabs and spaces
     print("\n📄 Testing mixed tabs and spaces...")
-    results = yamlguard.lint_files([Path("samples/indentation/mixed_tabs_spaces.yaml")])
+    results = yamlguard.lint_files([SAMPLES_DIR / "indentation/mixed_tabs_spaces.yaml"])
     report = reporter.report(results)
     print(report)
     
     # Test sequence indentation
     print("\n📄 Testing sequence indentation...")
-    results = yamlguard.lint_files([Path("samples/indentation/sequence_indentation.yaml")])
+    results = yamlguard.lint_files([SAMPLES_DIR / "indentation/sequence_indentation.yaml"])
     report = reporter.report(results)
     print(report)
 
 
-def test_cosmetics_samples():
+def test_cosmetics_samples(yamlguard: YAMLGuard, reporter: StylishReporter):
     """Test cosmetics samples."""
     print("\n🎨 Testing Cosmetics Samples")
     print("=" * 50)
     
-    config = Config()
-    config.cosmetics.enabled = True
-    config.cosmetics.line_length = 100  # Lower limit for testing
-    
-    yamlguard = YAMLGuard(config=config)
-    reporter = StylishReporter(color=True, verbose=True)
+    # Same settings as the shared run, with a lower line limit for testing
+    config = yamlguard.config.model_copy(deep=True)
+    config.cosmetics.line_length = 100
+    cosmetics_guard = YAMLGuard(config=config)
     
     # Test trailing spaces
     print("\n📄 Testing trailing spaces...")
-    results = yamlguard.lint_files([Path("samples/cosmetics/trailing_spaces.yaml")])
+    results = cosmetics_guard.lint_files([SAMPLES_DIR / "cosmetics/trailing_spaces.yaml"])
     report = reporter.report(results)
     print(report)
     
     # Test duplicate keys
     print("\n📄 Testing duplicate keys...")
-    results = yamlguard.lint_files([Path("samples/cosmetics/duplicate_keys.yaml")])
+    results = cosmetics_guard.lint_files([SAMPLES_DIR / "cosmetics/duplicate_keys.yaml"])
     report = reporter.report(results)
     print(report)
     
     # Test long lines
     print("\n📄 Testing long lines...")
-    results = yamlguard.lint_files([Path("samples/cosmetics/long_lines.yaml")])
+    results = cosmetics_guard.lint_files([SAMPLES_DIR / "cosmetics/long_lines.yaml"])
     report = reporter.report(results)
     print(report)
     
     # Test mixed quotes
     print("\n📄 Testing mixed quotes...")
-    results = yamlguard.lint_files([Path("samples/cosmetics/mixed_quotes.yaml")])
+    results = cosmetics_guard.lint_files([SAMPLES_DIR / "cosmetics/mixed_quotes.yaml"])
     report = reporter.report(results)
     print(report)
     
     # Test boolean format
     print("\n📄 Testing boolean format...")
-    results = yamlguard.lint_files([Path("samples/cosmetics/boolean_format.yaml")])
+    results = cosmetics_guard.lint_files([SAMPLES_DIR / "cosmetics/boolean_format.yaml"])
     report = reporter.report(results)
     print(report)
 
 
-def test_kubernetes_samples():
+def test_kubernetes_samples(yamlguard: YAMLGuard, reporter: StylishReporter):
     """Test Kubernetes samples."""
     print("\n🚀 Testing Kubernetes Samples")
     print("=" * 50)
     
-    config = Config()
-    config.kubernetes.enabled = True
-    config.kubernetes.version = "1.30"
-    config.kubernetes.strict = False
-    
-    yamlguard = YAMLGuard(config=config)
-    reporter = StylishReporter(color=True, verbose=True)
-    
     # Test valid deployment
     print("\n📄 Testing valid deployment...")
-    results = yamlguard.kube_validate_files([Path("samples/kubernetes/valid_deployment.yaml")])
+    results = yamlguard.kube_validate_files([SAMPLES_DIR / "kubernetes/valid_deployment.yaml"])
     report = reporter.report(results)
     print(report)
     
     # Test invalid deployment
     print("\n📄 Testing invalid deployment...")
-    results = yamlguard.kube_validate_files([Path("samples/kubernetes/invalid_deployment.yaml")])
+    results = yamlguard.kube_validate_files([SAMPLES_DIR / "kubernetes/invalid_deployment.yaml"])
     report = reporter.report(results)
     print(report)
     
     # Test multi-document
     print("\n📄 Testing multi-document...")
-    results = yamlguard.kube_validate_files([Path("samples/kubernetes/multi_document.yaml")])
+    results = yamlguard.kube_validate_files([SAMPLES_DIR / "kubernetes/multi_document.yaml"])
     report = reporter.report(results)
     print(report)
     
     # Test invalid types
     print("\n📄 Testing invalid types...")
-    results = yamlguard.kube_validate_files([Path("samples/kubernetes/invalid_types.yaml")])
+    results = yamlguard.kube_validate_files([SAMPLES_DIR / "kubernetes/invalid_types.yaml"])
     report = reporter.report(results)
     print(report)
 
 
-def test_secrets_samples():
+def test_secrets_samples(yamlguard: YAMLGuard, reporter: StylishReporter):
     """Test secrets samples."""
     print("\n🔐 Testing Secrets Samples")
     print("=" * 50)
     
-    config = Config()
-    config.secrets.enabled = True
-    config.secrets.entropy_threshold = 4.0  # Lower threshold for demo
-    
-    yamlguard = YAMLGuard(config=config)
-    reporter = StylishReporter(color=True, verbose=True)
-    
     # Test AWS credentials
     print("\n📄 Testing AWS credentials...")
-    results = yamlguard.scan_secrets_files([Path("samples/secrets/aws_credentials.yaml")])
+    results = yamlguard.scan_secrets_files([SAMPLES_DIR / "secrets/aws_credentials.yaml"])
     report = reporter.report(results)
     print(report)
     
     # Test GitHub tokens
     print("\n📄 Testing GitHub tokens...")
-    results = yamlguard.scan_secrets_files([Path("samples/secrets/github_tokens.yaml")])
+    results = yamlguard.scan_secrets_files([SAMPLES_DIR / "secrets/github_tokens.yaml"])
     report = reporter.report(results)
     print(report)
     
     # Test database credentials
     print("\n📄 Testing database credentials...")
-    results = yamlguard.scan_secrets_files([Path("samples/secrets/database_credentials.yaml")])
+    results = yamlguard.scan_secrets_files([SAMPLES_DIR / "secrets/database_credentials.yaml"])
     report = reporter.report(results)
     print(report)
     
     # Test private keys
     print("\n📄 Testing private keys...")
-    results = yamlguard.scan_secrets_files([Path("samples/secrets/private_keys.yaml")])
+    results = yamlguard.scan_secrets_files([SAMPLES_DIR / "secrets/private_keys.yaml"])
     report = reporter.report(results)
     print(report)
     
     # Test API keys
     print("\n📄 Testing API keys...")
-    results = yamlguard.scan_secrets_files([Path("samples/secrets/api_keys.yaml")])
+    results = yamlguard.scan_secrets_files([SAMPLES_DIR / "secrets/api_keys.yaml"])
     report = reporter.report(results)
     print(report)
 
 
-def test_auto_fix():
+def test_auto_fix(yamlguard: YAMLGuard):
     """Test auto-fix functionality."""
     print("\n🔧 Testing Auto-fix")
     print("=" * 50)
     
-    config = Config()
-    config.indent.step = 2
-    
-    yamlguard = YAMLGuard(config=config)
-    
     # Test fixing indentation
     print("\n📄 Testing indentation fix...")
-    results = yamlguard.fix_files([Path("samples/indentation/bad_indentation.yaml")], in_place=False)
+    results = yamlguard.fix_files([SAMPLES_DIR / "indentation/bad_indentation.yaml"], in_place=False)
     
     for result in results:
         if result['success']:
@@ -203,7 +174,7 @@ def test_auto_fix():
     
     # Test fixing cosmetics
     print("\n📄 Testing cosmetics fix...")
-    results = yamlguard.fix_files([Path("samples/cosmetics/trailing_spaces.yaml")], in_place=False)
+    results = yamlguard.fix_files([SAMPLES_DIR / "cosmetics/trailing_spaces.yaml"], in_place=False)
     
     for result in results:
         if result['success']:
@@ -216,27 +187,20 @@ def test_auto_fix():
             print(f"❌ Failed: {result['file']} - {result['error']}")
 
 
-def test_complex_samples():
+def test_complex_samples(yamlguard: YAMLGuard, reporter: StylishReporter):
     """Test complex samples."""
     print("\n🏗️ Testing Complex Samples")
     print("=" * 50)
     
-    config = Config()
-    config.indent.step = 2
-    config.cosmetics.enabled = True
-    
-    yamlguard = YAMLGuard(config=config)
-    reporter = StylishReporter(color=True, verbose=True)
-    
     # Test large config
     print("\n📄 Testing large config...")
-    results = yamlguard.lint_files([Path("samples/complex/large_config.yaml")])
+    results = yamlguard.lint_files([SAMPLES_DIR / "complex/large_config.yaml"])
     report = reporter.report(results)
     print(report)
     
     # Test multi-document complex
     print("\n📄 Testing multi-document complex...")
-    results = yamlguard.lint_files([Path("samples/complex/multi_document_complex.yaml")])
+    results = yamlguard.lint_files([SAMPLES_DIR / "complex/multi_document_complex.yaml"])
     report = reporter.report(results)
     print(report)
 
@@ -246,24 +210,38 @@ def main():
     print("🎯 YAMLGuard Sample Testing")
     print("=" * 60)
     
+    # One configuration covering every phase, so a single YAMLGuard and
+    # reporter (with their compiled patterns and caches) serve all of them
+    config = Config()
+    config.indent.step = 2
+    config.cosmetics.enabled = True
+    config.kubernetes.enabled = True
+    config.kubernetes.version = "1.30"
+    config.kubernetes.strict = False
+    config.secrets.enabled = True
+    config.secrets.entropy_threshold = 4.0  # Lower threshold for demo
+    
+    yamlguard = YAMLGuard(config=config)
+    reporter = StylishReporter(color=True, verbose=True)
+    
     try:
         # Test indentation samples
-        test_indentation_samples()
+        test_indentation_samples(yamlguard, reporter)
         
         # Test cosmetics samples
-        test_cosmetics_samples()
+        test_cosmetics_samples(yamlguard, reporter)
         
         # Test Kubernetes samples
-        test_kubernetes_samples()
+        test_kubernetes_samples(yamlguard, reporter)
         
         # Test secrets samples
-        test_secrets_samples()
+        test_secrets_samples(yamlguard, reporter)
         
         # Test auto-fix
-        test_auto_fix()
+        test_auto_fix(yamlguard)
         
         # Test complex samples
-        test_complex_samples()
+        test_complex_samples(yamlguard, reporter)
         
         print("\n✅ All sample tests completed successfully!")
         
@@ -160,6 +160,19 @@ class TestConfig:
         assert loaded_config.kubernetes.version == "1.29"
         assert loaded_config.secrets.enabled is True
     
+    def test_save_and_load_toml(self, tmp_path):
+        """Test saving and loading configuration as TOML."""
+        config = Config()
+        config.indent.step = 4
+        config.secrets.allowlist = ["*.test.yaml"]
+        
+        config_file = tmp_path / "yamlguard.toml"
+        config.save(config_file)
+        
+        loaded_config = Config.from_file(config_file)
+        assert loaded_config == config
+        assert loaded_config.secrets.baseline is None
+    
     def test_find_config(self, tmp_path):
         """Test finding configuration in directory hierarchy."""
         # Create a config file in a subdirectory
@@ -184,6 +197,50 @@ class TestConfig:
         # Test not finding config
         found_config = Config.find_config(tmp_path / "nonexistent")
         assert found_config is None
+    
+    def test_find_config_sees_new_file(self, tmp_path):
+        """Test that a config created after a failed lookup is found."""
+        assert Config.find_config(tmp_path) is None
+        
+        (tmp_path / ".yamlguard.yml").write_text("indent:\n  step: 4\n")
+        
+        found_config = Config.find_config(tmp_path)
+        assert found_config is not None
+        assert found_config.indent.step == 4
+    
+    def test_find_config_reuses_parsed_file(self, tmp_path):
+        """Test that repeated lookups share the parse but not the instance."""
+        config_file = tmp_path / ".yamlguard.yml"
+        config_file.write_text("indent:\n  step: 4\n")
+        
+        first = Config.find_config(tmp_path)
+        first.indent.step = 8
+        
+        second = Config.find_config(tmp_path)
+        assert second is not first
+        assert second.indent.step == 4
+        
+        config_file.write_text("indent:\n  step: 6\n  strict: false\n")
+        assert Config.find_config(tmp_path).indent.step == 6
+    
+    def test_from_file_reuses_parsed_file(self, tmp_path, monkeypatch):
+        """Test that an unchanged file is parsed once across from_file calls."""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("indent:\n  step: 4\n")
+        
+        parse_file = Config._parse_file.__func__
+        parsed = []
+        
+        def counting_parse(cls, config_path):
+            parsed.append(config_path)
+            return parse_file(cls, config_path)
+        
+        monkeypatch.setattr(Config, "_parse_file", classmethod(counting_parse))
+        
+        first = Config.from_file(config_file)
+        first.indent.step = 8
+        assert Config.from_file(config_file).indent.step == 4
+        assert len(parsed) == 1
 
 
 class TestIndentConfig:
@@ -9,6 +9,12 @@ import pytest
 from yamlguard.cosmetics import CosmeticsChecker, CosmeticsError
 
 
+@pytest.fixture(scope="module")
+def checker():
+    """Shared CosmeticsChecker; check_content resets its state on every call."""
+    return CosmeticsChecker()
+
+
 class TestCosmeticsChecker:
     """Test cases for CosmeticsChecker."""
     
@@ -19,10 +25,8 @@ class TestCosmeticsChecker:
         assert checker.strict is False
         assert checker.errors == []
     
-    def test_trailing_spaces(self):
+    def test_trailing_spaces(self, checker):
         """Test detection of trailing spaces."""
-        checker = CosmeticsChecker()
-        
         yaml_with_trailing = """
 apiVersion: v1
 kind: ConfigMap
@@ -38,10 +42,8 @@ data:
         trailing_errors = [e for e in errors if e.rule == 'trailing-spaces']
         assert len(trailing_errors) > 0
     
-    def test_tabs(self):
+    def test_tabs(self, checker):
         """Test detection of tab characters."""
-        checker = CosmeticsChecker()
-        
         yaml_with_tabs = """
 apiVersion: v1
 kind: ConfigMap
@@ -57,16 +59,33 @@ data:
         tab_errors = [e for e in errors if e.rule == 'tabs']
         assert len(tab_errors) > 0
     
-    def test_bom(self):
+    def test_bom(self, checker):
         """Test detection of BOM (Byte Order Mark)."""
-        checker = CosmeticsChecker()
-        
         yaml_with_bom = "\ufeffapiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: test"
         
         errors = checker.check_content(yaml_with_bom)
         bom_errors = [e for e in errors if e.rule == 'bom']
         assert len(bom_errors) > 0
     
+    def test_bom_does_not_shift_columns(self, checker):
+        """Test that a BOM is not counted in first-line columns."""
+        errors = checker.check_content("\ufeffkey: value  \nother: 1\n")
+        
+        assert [e.rule for e in errors] == ['trailing-spaces', 'bom']
+        assert errors[0].column == len("key: value") + 1
+        assert errors[0].fix == "key: value"
+    
+    def test_check_file_large_file(self, checker, tmp_path):
+        """Test that check_file reads large (memory-mapped) files like check_content."""
+        content = "".join(f"key{i}: value  \r\n" for i in range(10000))
+        file_path = tmp_path / "large.yaml"
+        file_path.write_bytes(content.encode('utf-8'))
+        
+        errors = checker.check_file(file_path)
+        assert len(errors) == 10000
+        assert {e.rule for e in errors} == {'trailing-spaces'}
+        assert errors[-1].line == 10000
+    
     def test_line_length(self):
         """Test detection of overly long lines."""
         checker = CosmeticsChecker(line_length=50)
@@ -77,10 +96,8 @@ data:
         length_errors = [e for e in errors if e.rule == 'line-length']
         assert len(length_errors) > 0
     
-    def test_duplicate_keys(self):
+    def test_duplicate_keys(self, checker):
         """Test detection of duplicate keys."""
-        checker = CosmeticsChecker()
-        
         yaml_with_duplicates = """
 apiVersion: v1
 kind: ConfigMap
@@ -96,10 +113,47 @@ data:
         duplicate_errors = [e for e in errors if e.rule == 'duplicate-key']
         assert len(duplicate_errors) > 0
     
-    def test_mixed_quotes(self):
-        """Test detection of mixed quote usage."""
-        checker = CosmeticsChecker()
+    def test_duplicate_keys_multi_document(self, checker):
+        """Test that duplicate keys are located and scoped per mapping."""
+        yaml_documents = """apiVersion: v1
+kind: ConfigMap
+---
+apiVersion: v1
+kind: Service
+metadata:
+  name: a
+  name: b
+"""
+        
+        errors = checker.check_content(yaml_documents)
+        duplicate_errors = [e for e in errors if e.rule == 'duplicate-key']
+        assert len(duplicate_errors) == 1
+        assert duplicate_errors[0].line == 8
+        assert duplicate_errors[0].column == 3
+    
+    def test_duplicate_keys_through_alias(self, checker):
+        """Test that a mapping reached again through an alias is not a duplicate."""
+        yaml_with_alias = """base: &base
+  x: 1
+  y: 2
+other:
+  <<: *base
+  ref: *base
+"""
+        
+        errors = checker.check_content(yaml_with_alias)
+        assert not [e for e in errors if e.rule == 'duplicate-key']
+    
+    def test_duplicate_keys_with_redefined_anchor(self, checker):
+        """Test that YAML 1.2 anchor redefinition does not hide duplicate keys."""
+        yaml_with_anchors = "a: &x 1\nb: &x 2\nc: 3\nc: 4\n"
         
+        errors = checker.check_content(yaml_with_anchors)
+        duplicate_errors = [e for e in errors if e.rule == 'duplicate-key']
+        assert [(e.line, e.column) for e in duplicate_errors] == [(4, 1)]
+    
+    def test_mixed_quotes(self, checker):
+        """Test detection of mixed quote usage."""
         yaml_with_mixed_quotes = """
 apiVersion: v1
 kind: ConfigMap
@@ -115,10 +169,8 @@ data:
         quote_errors = [e for e in errors if e.rule == 'mixed-quotes']
         assert len(quote_errors) > 0
     
-    def test_boolean_format(self):
+    def test_boolean_format(self, checker):
         """Test detection of non-canonical boolean values."""
-        checker = CosmeticsChecker()
-        
         yaml_with_booleans = """
 apiVersion: v1
 kind: ConfigMap
@@ -135,10 +187,22 @@ data:
         boolean_errors = [e for e in errors if e.rule == 'boolean-format']
         assert len(boolean_errors) > 0
     
-    def test_fix_cosmetics(self):
-        """Test fixing cosmetics issues."""
-        checker = CosmeticsChecker()
+    def test_errors_by_rule(self, checker):
+        """Test that errors are also indexed by rule."""
+        yaml_with_issues = "metadata:\n  name: test  \n\tkey: value\n  other: yes  \n"
         
+        errors = checker.check_content(yaml_with_issues)
+        assert checker.errors_by_rule['trailing-spaces'] == [
+            e for e in errors if e.rule == 'trailing-spaces'
+        ]
+        assert len(checker.errors_by_rule['tabs']) == 1
+        assert sum(len(group) for group in checker.errors_by_rule.values()) == len(errors)
+        
+        checker.check_content("key: value\n")
+        assert checker.errors_by_rule == {}
+    
+    def test_fix_cosmetics(self, checker):
+        """Test fixing cosmetics issues."""
         yaml_with_issues = """
 apiVersion: v1
 kind: ConfigMap
@@ -158,20 +222,16 @@ data:
         # Check that tabs are replaced with spaces
         assert '\t' not in fixed_yaml
     
-    def test_empty_content(self):
+    def test_empty_content(self, checker):
         """Test checking empty content."""
-        checker = CosmeticsChecker()
-        
         errors = checker.check_content("")
         assert len(errors) == 0
         
         errors = checker.check_content("\n\n")
         assert len(errors) == 0
     
-    def test_valid_content(self):
+    def test_valid_content(self, checker):
         """Test checking valid YAML content."""
-        checker = CosmeticsChecker()
-        
         valid_yaml = """
 apiVersion: v1
 kind: ConfigMap
@@ -186,10 +246,8 @@ data:
         errors = checker.check_content(valid_yaml)
         assert len(errors) == 0
     
-    def test_error_properties(self):
+    def test_error_properties(self, checker):
         """Test that errors have the correct properties."""
-        checker = CosmeticsChecker()
-        
         yaml_with_issues = """
 apiVersion: v1
 kind: ConfigMap
@@ -234,10 +292,8 @@ metadata:
         assert error_dict['severity'] == 'warning'
         assert error_dict['fix'] == '  name: test'
     
-    def test_get_rule_documentation(self):
+    def test_get_rule_documentation(self, checker):
         """Test getting rule documentation."""
-        checker = CosmeticsChecker()
-        
         docs = checker.get_rule_documentation()
         assert isinstance(docs, dict)
         assert 'trailing-spaces' in docs
@@ -295,10 +351,8 @@ data:
         # Strict mode should be more aggressive
         assert len(errors_strict) >= len(errors_normal)
     
-    def test_context_preservation(self):
+    def test_context_preservation(self, checker):
         """Test that context is preserved during fixing."""
-        checker = CosmeticsChecker()
-        
         yaml_with_context = """
 apiVersion: v1
 kind: ConfigMap
@@ -318,10 +372,8 @@ data:
         assert "# This is a comment" in fixed_yaml
         assert "# Another comment" in fixed_yaml
     
-    def test_multiple_issues(self):
+    def test_multiple_issues(self, checker):
         """Test detection of multiple issues in the same file."""
-        checker = CosmeticsChecker()
-        
         yaml_with_multiple_issues = """
 apiVersion: v1
 kind: ConfigMap
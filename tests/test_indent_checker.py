@@ -10,6 +10,12 @@ from pathlib import Path
 from yamlguard.indent_checker import IndentationChecker, IndentationError
 
 
+@pytest.fixture(scope="module")
+def checker():
+    """Shared IndentationChecker; check_content resets its state on every call."""
+    return IndentationChecker(indent_step=2)
+
+
 class TestIndentationChecker:
     """Test cases for IndentationChecker."""
     
@@ -20,10 +26,8 @@ class TestIndentationChecker:
         assert checker.strict is True
         assert checker.errors == []
     
-    def test_check_content_valid(self):
+    def test_check_content_valid(self, checker):
         """Test checking valid YAML content."""
-        checker = IndentationChecker(indent_step=2)
-        
         valid_yaml = """
 apiVersion: v1
 kind: ConfigMap
@@ -38,10 +42,8 @@ data:
         errors = checker.check_content(valid_yaml)
         assert len(errors) == 0
     
-    def test_check_content_invalid_indentation(self):
+    def test_check_content_invalid_indentation(self, checker):
         """Test checking YAML with invalid indentation."""
-        checker = IndentationChecker(indent_step=2)
-        
         invalid_yaml = """
 apiVersion: v1
 kind: ConfigMap
@@ -60,10 +62,8 @@ data:
         indentation_errors = [e for e in errors if e.rule == 'indentation']
         assert len(indentation_errors) > 0
     
-    def test_check_content_mixed_indentation(self):
+    def test_check_content_mixed_indentation(self, checker):
         """Test checking YAML with mixed indentation."""
-        checker = IndentationChecker(indent_step=2)
-        
         mixed_yaml = """
 apiVersion: v1
 kind: ConfigMap
@@ -78,10 +78,8 @@ data:
         errors = checker.check_content(mixed_yaml)
         assert len(errors) > 0
     
-    def test_check_content_sequences(self):
+    def test_check_content_sequences(self, checker):
         """Test checking YAML with sequences."""
-        checker = IndentationChecker(indent_step=2)
-        
         sequence_yaml = """
 apiVersion: v1
 kind: ConfigMap
@@ -96,10 +94,8 @@ data:
         errors = checker.check_content(sequence_yaml)
         assert len(errors) == 0
     
-    def test_check_content_invalid_sequences(self):
+    def test_check_content_invalid_sequences(self, checker):
         """Test checking YAML with invalid sequence indentation."""
-        checker = IndentationChecker(indent_step=2)
-        
         invalid_sequence_yaml = """
 apiVersion: v1
 kind: ConfigMap
@@ -114,10 +110,8 @@ data:
         errors = checker.check_content(invalid_sequence_yaml)
         assert len(errors) > 0
     
-    def test_fix_indentation(self):
+    def test_fix_indentation(self, checker):
         """Test fixing indentation issues."""
-        checker = IndentationChecker(indent_step=2)
-        
         original_yaml = """
 apiVersion: v1
 kind: ConfigMap
@@ -141,10 +135,8 @@ data:
                 # This should be indented with 2 spaces
                 assert line.startswith('  ')
     
-    def test_get_suggested_fix(self):
+    def test_get_suggested_fix(self, checker):
         """Test getting suggested fixes for errors."""
-        checker = IndentationChecker(indent_step=2)
-        
         error = IndentationError(
             line=5,
             column=10,
@@ -183,20 +175,16 @@ data:
         errors_2_space = checker_4.check_content(yaml_4_space.replace("    ", "  "))
         assert len(errors_2_space) > 0
     
-    def test_empty_content(self):
+    def test_empty_content(self, checker):
         """Test checking empty content."""
-        checker = IndentationChecker(indent_step=2)
-        
         errors = checker.check_content("")
         assert len(errors) == 0
         
         errors = checker.check_content("\n\n")
         assert len(errors) == 0
     
-    def test_comments_preservation(self):
+    def test_comments_preservation(self, checker):
         """Test that comments are preserved during fixing."""
-        checker = IndentationChecker(indent_step=2)
-        
         yaml_with_comments = """
 apiVersion: v1
 kind: ConfigMap
@@ -216,10 +204,8 @@ data:
         assert "# This is a comment" in fixed_yaml
         assert "# Another comment" in fixed_yaml
     
-    def test_multiline_strings(self):
+    def test_multiline_strings(self, checker):
         """Test handling of multiline strings."""
-        checker = IndentationChecker(indent_step=2)
-        
         yaml_multiline = """
 apiVersion: v1
 kind: ConfigMap
@@ -236,10 +222,17 @@ data:
         errors = checker.check_content(yaml_multiline)
         assert len(errors) == 0
     
-    def test_nested_structures(self):
+    def test_continuation_lines_use_nearest_level(self, checker):
+        """Test that off-level lines are compared with the nearest level, shallower on a tie."""
+        yaml_content = "a: >\n   text\nb:\n  c: 1\n     more\n"
+        
+        errors = checker.check_content(yaml_content)
+        mismatches = [(e.line, e.expected, e.actual) for e in errors
+                      if e.message.startswith("Indentation mismatch")]
+        assert mismatches == [(2, 3, 4), (5, 5, 6)]
+    
+    def test_nested_structures(self, checker):
         """Test handling of deeply nested structures."""
-        checker = IndentationChecker(indent_step=2)
-        
         nested_yaml = """
 apiVersion: v1
 kind: ConfigMap
@@ -263,10 +256,8 @@ data:
         errors = checker.check_content(nested_yaml)
         assert len(errors) == 0
     
-    def test_error_properties(self):
+    def test_error_properties(self, checker):
         """Test that errors have the correct properties."""
-        checker = IndentationChecker(indent_step=2)
-        
         invalid_yaml = """
 apiVersion: v1
 kind: ConfigMap
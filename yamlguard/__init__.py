@@ -12,9 +12,12 @@ __version__ = "0.1.0"
 __author__ = "YAMLGuard Team"
 __email__ = "team@yamlguard.dev"
 
-from yamlguard.core import YAMLGuard
-from yamlguard.config import Config
-from yamlguard.reporters import Reporter, StylishReporter, JSONLReporter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from yamlguard.config import Config
+    from yamlguard.core import YAMLGuard
+    from yamlguard.reporters import JSONLReporter, Reporter, StylishReporter
 
 __all__ = [
     "YAMLGuard",
@@ -23,3 +26,25 @@ __all__ = [
     "StylishReporter",
     "JSONLReporter",
 ]
+
+# Module defining each public name; imported on first access so that
+# `import yamlguard` (and the CLI's version/help paths) stay cheap
+_LAZY_IMPORTS = {
+    "YAMLGuard": "yamlguard.core",
+    "Config": "yamlguard.config",
+    "Reporter": "yamlguard.reporters",
+    "StylishReporter": "yamlguard.reporters",
+    "JSONLReporter": "yamlguard.reporters",
+}
+
+
+def __getattr__(name: str):
+    """Import public classes on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is not None:
+        from importlib import import_module
+        
+        value = getattr(import_module(module_name), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,89 @@
+"""
+On-disk cache of per-file check results.
+
+Results are stored as small JSON files named by a BLAKE2b digest of the
+file content and the settings that produced them, so edited files and
+changed settings simply miss and nothing ever needs invalidating.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+class ResultCache:
+    """
+    Content-addressed store for per-file check results.
+    
+    Writes go through a temporary file and os.replace, so concurrent pool
+    workers never observe a partially written entry.
+    """
+    
+    def __init__(self, cache_dir: Union[str, Path]):
+        """
+        Initialize the result cache.
+        
+        Args:
+            cache_dir: Directory holding the cache entries (created on first write)
+        """
+        self.cache_dir = Path(cache_dir)
+    
+    @staticmethod
+    def key(content: str, fingerprint: str) -> str:
+        """
+        Compute the cache key for a file.
+        
+        Args:
+            content: File content
+            fingerprint: Identifies the check and the settings it ran with
+            
+        Returns:
+            Hex digest naming the cache entry
+        """
+        digest = hashlib.blake2b(fingerprint.encode('utf-8'), digest_size=16)
+        digest.update(b'\0')
+        digest.update(content.encode('utf-8'))
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result.
+        
+        Args:
+            key: Cache key from key()
+            
+        Returns:
+            The cached result, or None if there is no usable entry
+        """
+        try:
+            with open(self.cache_dir / f"{key}.json", 'rb') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a result.
+        
+        Failures are ignored; a read-only or full disk only means the
+        result is computed again next time.
+        
+        Args:
+            key: Cache key from key()
+            value: JSON-serializable result
+        """
+        path = self.cache_dir / f"{key}.json"
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(value, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
@@ -6,17 +6,19 @@ for all YAMLGuard functionality including linting, validation, and secrets scann
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
 from rich.text import Text
 
-from yamlguard.config import Config
-from yamlguard.core import YAMLGuard
-from yamlguard.reporters import Reporter, StylishReporter, JSONLReporter
+# The checkers, pydantic config and reporters are imported by the commands
+# that use them, so `yamlguard version` and `--help` start quickly
+if TYPE_CHECKING:
+    from yamlguard.config import Config
+    from yamlguard.reporters import Reporter
 
 # Initialize CLI app
 app = typer.Typer(
@@ -39,15 +41,13 @@ def lint(
     format: str = typer.Option("stylish", "--format", "-f", help="Output format (stylish, json, jsonl)"),
     color: bool = typer.Option(True, "--color/--no-color", help="Enable/disable colored output"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
+    jobs: Optional[int] = typer.Option(None, "--jobs", "-j", min=0, help="Worker processes (0 = one per CPU for 64+ files)"),
     config: Optional[Path] = typer.Option(None, "--config", "-c", help="Configuration file path")
 ) -> None:
     """Lint YAML files for indentation and style issues."""
     try:
         # Load configuration
-        if config:
-            cfg = Config.from_file(config)
-        else:
-            cfg = Config.find_config() or Config()
+        cfg = _load_config(config)
         
         # Override config with CLI options
         cfg.indent.step = indent
@@ -56,22 +56,18 @@ def lint(
         cfg.reporter.format = format
         cfg.reporter.color = color
         cfg.reporter.verbose = verbose
+        if jobs is not None:
+            cfg.jobs = jobs
         
         # Initialize YAMLGuard
+        from yamlguard.core import YAMLGuard
         yamlguard = YAMLGuard(config=cfg)
         
         # Run linting
         results = yamlguard.lint_files(paths)
         
-        # Generate report
-        reporter = _get_reporter(cfg)
-        report = reporter.report(results)
-        
-        # Output report
-        if format == "json" or format == "jsonl":
-            print(report)
-        else:
-            console.print(report)
+        # Generate and output report
+        _print_report(cfg, results)
         
         # Exit with appropriate code
         if any(not result.get('success', True) for result in results):
@@ -91,15 +87,13 @@ def kube_validate(
     format: str = typer.Option("stylish", "--format", "-f", help="Output format (stylish, json, jsonl)"),
     color: bool = typer.Option(True, "--color/--no-color", help="Enable/disable colored output"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
+    jobs: Optional[int] = typer.Option(None, "--jobs", "-j", min=0, help="Worker processes (0 = one per CPU for 64+ files)"),
     config: Optional[Path] = typer.Option(None, "--config", "-c", help="Configuration file path")
 ) -> None:
     """Validate Kubernetes manifests against official schemas."""
     try:
         # Load configuration
-        if config:
-            cfg = Config.from_file(config)
-        else:
-            cfg = Config.find_config() or Config()
+        cfg = _load_config(config)
         
         # Override config with CLI options
         cfg.kubernetes.version = version
@@ -108,22 +102,18 @@ def kube_validate(
         cfg.reporter.format = format
         cfg.reporter.color = color
         cfg.reporter.verbose = verbose
+        if jobs is not None:
+            cfg.jobs = jobs
         
         # Initialize YAMLGuard
+        from yamlguard.core import YAMLGuard
         yamlguard = YAMLGuard(config=cfg)
         
         # Run validation
         results = yamlguard.kube_validate_files(paths)
         
-        # Generate report
-        reporter = _get_reporter(cfg)
-        report = reporter.report(results)
-        
-        # Output report
-        if format == "json" or format == "jsonl":
-            print(report)
-        else:
-            console.print(report)
+        # Generate and output report
+        _print_report(cfg, results)
         
         # Exit with appropriate code
         if any(not result.get('success', True) for result in results):
@@ -144,15 +134,13 @@ def scan_secrets(
     format: str = typer.Option("stylish", "--format", "-f", help="Output format (stylish, json, jsonl)"),
     color: bool = typer.Option(True, "--color/--no-color", help="Enable/disable colored output"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
+    jobs: Optional[int] = typer.Option(None, "--jobs", "-j", min=0, help="Worker processes (0 = one per CPU for 64+ files)"),
     config: Optional[Path] = typer.Option(None, "--config", "-c", help="Configuration file path")
 ) -> None:
     """Scan YAML files for secrets and credentials."""
     try:
         # Load configuration
-        if config:
-            cfg = Config.from_file(config)
-        else:
-            cfg = Config.find_config() or Config()
+        cfg = _load_config(config)
         
         # Override config with CLI options
         cfg.secrets.baseline = baseline
@@ -162,22 +150,18 @@ def scan_secrets(
         cfg.reporter.format = format
         cfg.reporter.color = color
         cfg.reporter.verbose = verbose
+        if jobs is not None:
+            cfg.jobs = jobs
         
         # Initialize YAMLGuard
+        from yamlguard.core import YAMLGuard
         yamlguard = YAMLGuard(config=cfg)
         
         # Run secrets scanning
         results = yamlguard.scan_secrets_files(paths)
         
-        # Generate report
-        reporter = _get_reporter(cfg)
-        report = reporter.report(results)
-        
-        # Output report
-        if format == "json" or format == "jsonl":
-            print(report)
-        else:
-            console.print(report)
+        # Generate and output report
+        _print_report(cfg, results)
         
         # Exit with appropriate code
         if any(not result.get('success', True) for result in results):
@@ -199,26 +183,30 @@ def fix(
     """Fix indentation issues in YAML files."""
     try:
         # Load configuration
-        if config:
-            cfg = Config.from_file(config)
-        else:
-            cfg = Config.find_config() or Config()
+        cfg = _load_config(config)
         
         # Override config with CLI options
         cfg.indent.step = indent
         
         # Initialize YAMLGuard
+        from yamlguard.core import YAMLGuard
         yamlguard = YAMLGuard(config=cfg)
         
         # Run fixing
         results = yamlguard.fix_files(paths, in_place=in_place, backup=backup)
         
-        # Output results
+        # Output results in one print; plain Text skips rich's markup parsing
+        lines = []
         for result in results:
-            if result['success']:
-                console.print(f"[green]✅ Fixed: {result['file']}[/green]")
+            if result['success'] and not result['changed']:
+                lines.append(Text(f"✅ Unchanged: {result['file']}", style="dim"))
+            elif result['success']:
+                lines.append(Text(f"✅ Fixed: {result['file']}", style="green"))
             else:
-                console.print(f"[red]❌ Failed: {result['file']} - {result['error']}[/red]")
+                lines.append(Text(f"❌ Failed: {result['file']} - {result['error']}", style="red"))
+        
+        if lines:
+            console.print(Text("\n").join(lines))
         
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
@@ -235,6 +223,7 @@ def init(
     """Initialize YAMLGuard configuration in a directory."""
     try:
         # Create configuration
+        from yamlguard.config import Config
         cfg = Config()
         cfg.indent.step = indent
         cfg.kubernetes.version = kube_version
@@ -271,12 +260,47 @@ def version() -> None:
         sys.exit(1)
 
 
-def _get_reporter(config: Config) -> Reporter:
-    """Get appropriate reporter based on configuration."""
-    if config.reporter.format == "jsonl":
-        return JSONLReporter(color=config.reporter.color, verbose=config.reporter.verbose)
+def _load_config(config: Optional[Path]) -> "Config":
+    """Load the configuration given on the command line or found on disk."""
+    from yamlguard.config import Config
+    
+    if not config:
+        return Config.find_config() or Config()
+    
+    return Config.from_file(config)
+
+
+def _print_report(config: "Config", results: List[dict]) -> None:
+    """Print the report for results in the configured format."""
+    reporter = _get_reporter(config)
+    
+    if config.reporter.format in ("json", "jsonl"):
+        # Stream records as they are serialized instead of joining them first
+        reporter.write(results, sys.stdout)
     else:
-        return StylishReporter(color=config.reporter.color, verbose=config.reporter.verbose)
+        console.print(reporter.report(results))
+
+
+def _get_reporter(config: "Config") -> "Reporter":
+    """Get appropriate reporter based on configuration."""
+    return _reporter_for(config.reporter.format, config.reporter.color, config.reporter.verbose)
+
+
+# Reporter class for each output format, looked up in yamlguard.reporters
+_REPORTERS = {
+    "stylish": "StylishReporter",
+    "json": "JSONLReporter",
+    "jsonl": "JSONLReporter",
+}
+
+
+@lru_cache(maxsize=8)
+def _reporter_for(format: str, color: bool, verbose: bool) -> "Reporter":
+    """Build a reporter; reporters hold no per-report state so they are shared."""
+    from yamlguard import reporters
+    
+    reporter_class = getattr(reporters, _REPORTERS.get(format, "StylishReporter"))
+    return reporter_class(color=color, verbose=verbose)
 
 
 def main() -> None:
@@ -5,18 +5,107 @@ Handles loading and validation of configuration from .yamlguard.yml files
 and command-line arguments.
 """
 
+import json
 import os
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
 import tomli
 import tomli_w
-from pydantic import BaseModel, Field, validator
+import yaml
+from pydantic import BaseModel, ConfigDict, Field
+
+try:
+    # LibYAML bindings; the config module avoids importing the ruamel-based loader
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+# Numeric severity levels, higher is more severe
+SEVERITY_LEVELS = {
+    "error": 3,
+    "warning": 2,
+    "info": 1,
+}
+
+# Configuration file names in order of preference
+CONFIG_NAMES = (".yamlguard.yml", ".yamlguard.toml", "yamlguard.yml", "yamlguard.toml")
+
+
+@lru_cache(maxsize=1024)
+def _config_files_in(directory: str, mtime_ns: int) -> Tuple[str, ...]:
+    """
+    List the configuration files present in a directory.
+    
+    Uses a single scandir instead of probing every candidate name. The
+    directory's mtime is part of the cache key, so adding or removing a
+    file invalidates the cached listing.
+    
+    Args:
+        directory: Directory to look in
+        mtime_ns: Modification time of the directory
+        
+    Returns:
+        Names of configuration files found, in order of preference
+    """
+    try:
+        with os.scandir(directory) as entries:
+            present = {entry.name for entry in entries
+                       if entry.name in CONFIG_NAMES and entry.is_file()}
+    except OSError:
+        return ()
+    
+    return tuple(name for name in CONFIG_NAMES if name in present)
+
+
+@lru_cache(maxsize=32)
+def _load_config_file(model: type, config_path: str, mtime_ns: int, size: int) -> "Config":
+    """
+    Parse a configuration file for from_file.
+    
+    The file's mtime and size are part of the cache key, so an edited file
+    is parsed again. Callers must copy the result before modifying it.
+    """
+    return model._parse_file(Path(config_path))
+
+
+@lru_cache(maxsize=None)
+def _yaml_template(model: type) -> str:
+    """
+    Build a YAML format string for a configuration model.
+    
+    The config schema is fixed, so the document layout is generated once
+    per model class with one placeholder per field. Nested sections use
+    "section__field" placeholders.
+    
+    Args:
+        model: Pydantic model class
+        
+    Returns:
+        YAML document template
+    """
+    lines = []
+    
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            lines.append(f"{name}:")
+            for sub_name in annotation.model_fields:
+                lines.append(f"  {sub_name}: {{{name}__{sub_name}}}")
+        else:
+            lines.append(f"{name}: {{{name}}}")
+    
+    return "\n".join(lines) + "\n"
 
 
 class IndentConfig(BaseModel):
     """Configuration for indentation checking."""
     
+    model_config = ConfigDict(validate_assignment=True)
+    
     step: int = Field(default=2, ge=1, le=8, description="Indentation step size in spaces")
     strict: bool = Field(default=True, description="Enforce consistent indentation")
     fix: bool = Field(default=False, description="Auto-fix indentation issues")
@@ -25,6 +114,8 @@ class IndentConfig(BaseModel):
 class CosmeticsConfig(BaseModel):
     """Configuration for YAML cosmetics checking."""
     
+    model_config = ConfigDict(validate_assignment=True)
+    
     enabled: bool = Field(default=True, description="Enable cosmetics checks")
     trailing_spaces: bool = Field(default=True, description="Check for trailing spaces")
     tabs: bool = Field(default=True, description="Check for tab usage")
@@ -36,8 +127,12 @@ class CosmeticsConfig(BaseModel):
 class KubernetesConfig(BaseModel):
     """Configuration for Kubernetes validation."""
     
+    model_config = ConfigDict(validate_assignment=True)
+    
     enabled: bool = Field(default=False, description="Enable Kubernetes validation")
-    version: str = Field(default="1.30", description="Kubernetes version to validate against")
+    # Checked by pydantic-core, which compiles the pattern once with the model
+    version: str = Field(default="1.30", pattern=r"^\d+\.\d+(\.\d+)?$",
+                         description="Kubernetes version to validate against")
     strict: bool = Field(default=False, description="Strict mode for schema validation")
     use_kubeconform: bool = Field(default=True, description="Use kubeconform for validation")
     cache_schemas: bool = Field(default=True, description="Cache downloaded schemas")
@@ -46,6 +141,8 @@ class KubernetesConfig(BaseModel):
 class SecretsConfig(BaseModel):
     """Configuration for secrets scanning."""
     
+    model_config = ConfigDict(validate_assignment=True)
+    
     enabled: bool = Field(default=False, description="Enable secrets scanning")
     baseline: Optional[Path] = Field(default=None, description="Baseline file for secrets")
     allowlist: List[str] = Field(default_factory=list, description="Paths to exclude from scanning")
@@ -57,15 +154,20 @@ class SecretsConfig(BaseModel):
 class ReporterConfig(BaseModel):
     """Configuration for output reporting."""
     
-    format: str = Field(default="stylish", description="Output format (stylish, json, jsonl)")
+    model_config = ConfigDict(validate_assignment=True)
+    
+    format: Literal["stylish", "json", "jsonl"] = Field(default="stylish", description="Output format (stylish, json, jsonl)")
     color: bool = Field(default=True, description="Enable colored output")
     verbose: bool = Field(default=False, description="Verbose output")
-    fail_on: str = Field(default="error", description="Fail on severity (error, warning, info)")
+    fail_on: Literal["error", "warning", "info"] = Field(default="error", description="Fail on severity (error, warning, info)")
 
 
 class Config(BaseModel):
     """Main YAMLGuard configuration."""
     
+    # Field constraints are checked by pydantic-core on every assignment
+    model_config = ConfigDict(validate_assignment=True)
+    
     # Core settings
     indent: IndentConfig = Field(default_factory=IndentConfig)
     cosmetics: CosmeticsConfig = Field(default_factory=CosmeticsConfig)
@@ -80,39 +182,34 @@ class Config(BaseModel):
     # CI settings
     ci: bool = Field(default=False, description="CI mode (non-interactive)")
     
-    @validator("reporter")
-    def validate_reporter_format(cls, v):
-        """Validate reporter format."""
-        valid_formats = ["stylish", "json", "jsonl"]
-        if v.format not in valid_formats:
-            raise ValueError(f"Invalid reporter format: {v.format}. Must be one of {valid_formats}")
-        return v
-    
-    @validator("kubernetes")
-    def validate_k8s_version(cls, v):
-        """Validate Kubernetes version format."""
-        # Basic version format validation (e.g., "1.30", "1.30.2")
-        import re
-        if not re.match(r"^\d+\.\d+(\.\d+)?$", v.version):
-            raise ValueError(f"Invalid Kubernetes version format: {v.version}")
-        return v
+    # Performance settings
+    jobs: int = Field(default=0, ge=0, description="Worker processes for multi-file runs (0 = one per CPU for 64+ files, else serial)")
+    cache_dir: Optional[Path] = Field(default=None, description="Directory for cached check results (unset = no caching)")
     
     @classmethod
     def from_file(cls, config_path: Union[str, Path]) -> "Config":
         """Load configuration from a TOML file."""
         config_path = Path(config_path)
         
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
         
-        with open(config_path, "r", encoding="utf-8") as f:
-            if config_path.suffix in [".yml", ".yaml"]:
-                import yaml
-                data = yaml.safe_load(f)
-            elif config_path.suffix == ".toml":
-                data = tomli.load(f)
-            else:
-                # Try to parse as TOML anyway
+        # Parsed files are shared by path, mtime and size; hand out a copy
+        # so callers can override options without affecting later loads
+        config = _load_config_file(cls, str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        return config.model_copy(deep=True)
+    
+    @classmethod
+    def _parse_file(cls, config_path: Path) -> "Config":
+        """Parse a YAML or TOML configuration file."""
+        if config_path.suffix in [".yml", ".yaml"]:
+            with open(config_path, "r", encoding="utf-8") as f:
+                data = yaml.load(f, Loader=SafeLoader)
+        else:
+            # TOML, also tried for unknown suffixes (tomli needs binary mode)
+            with open(config_path, "rb") as f:
                 data = tomli.load(f)
         
         return cls(**data)
@@ -122,36 +219,54 @@ class Config(BaseModel):
         """Find and load configuration file from directory hierarchy."""
         start_path = Path(start_path).resolve()
         
-        # Look for configuration files in order of preference
-        config_names = [".yamlguard.yml", ".yamlguard.toml", "yamlguard.yml", "yamlguard.toml"]
-        
-        for path in [start_path] + list(start_path.parents):
-            for config_name in config_names:
+        for path in chain((start_path,), start_path.parents):
+            # One stat per ancestor; the scandir behind _config_files_in only
+            # runs again when the directory's mtime changes
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                # Directory doesn't exist
+                continue
+            
+            for config_name in _config_files_in(str(path), mtime_ns):
                 config_file = path / config_name
-                if config_file.exists():
-                    try:
-                        return cls.from_file(config_file)
-                    except Exception as e:
-                        print(f"Warning: Failed to load config from {config_file}: {e}")
-                        continue
+                try:
+                    return cls.from_file(config_file)
+                except Exception as e:
+                    print(f"Warning: Failed to load config from {config_file}: {e}")
+                    continue
         
         return None
     
     def save(self, config_path: Union[str, Path]) -> None:
-        """Save configuration to a TOML file."""
+        """Save configuration to a YAML file, or TOML for .toml paths."""
         config_path = Path(config_path)
         
-        # Convert to dict and write as TOML
-        data = self.dict()
+        data = self.model_dump(mode="json")
+        
+        if config_path.suffix == ".toml":
+            # TOML has no null, so unset optional values are left out
+            data = {
+                key: {k: v for k, v in value.items() if v is not None}
+                if isinstance(value, dict) else value
+                for key, value in data.items() if value is not None
+            }
+            with open(config_path, "wb") as f:
+                tomli_w.dump(data, f)
+            return
+        
+        # JSON scalars and flow lists are valid YAML, so each value is
+        # serialized with json.dumps and substituted into the template
+        values = {}
+        for key, value in data.items():
+            if isinstance(value, dict):
+                for sub_key, sub_value in value.items():
+                    values[f"{key}__{sub_key}"] = json.dumps(sub_value, ensure_ascii=False)
+            else:
+                values[key] = json.dumps(value, ensure_ascii=False)
         
-        with open(config_path, "wb") as f:
-            tomli_w.dump(data, f)
+        config_path.write_text(_yaml_template(type(self)).format(**values), encoding="utf-8")
     
     def get_severity_threshold(self) -> int:
         """Get numeric severity threshold for filtering issues."""
-        severity_map = {
-            "error": 3,
-            "warning": 2, 
-            "info": 1,
-        }
-        return severity_map.get(self.reporter.fail_on, 3)
+        return SEVERITY_LEVELS.get(self.reporter.fail_on, 3)
@@ -5,18 +5,204 @@ Provides the main interface for all YAMLGuard functionality including
 linting, validation, secrets scanning, and fixing.
 """
 
+import os
+import re
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cached_property, lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from stat import S_ISDIR, S_ISREG
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Pattern, Set, Tuple, Union
 
+from yamlguard.cache import ResultCache
 from yamlguard.config import Config
 from yamlguard.cosmetics import CosmeticsChecker
 from yamlguard.indent_checker import IndentationChecker
-from yamlguard.kube import KubernetesValidator
-from yamlguard.loader import YAMLLoader
-from yamlguard.reporters import Reporter, StylishReporter, JSONLReporter
+from yamlguard.loader import YAMLLoader, read_source
 from yamlguard.secrets import SecretsRuleEngine, DetectSecretsAdapter, GitleaksAdapter
 
+if TYPE_CHECKING:
+    from yamlguard.kube import KubernetesValidator
+
+
+# Maximum number of file sources kept between passes by a YAMLGuard instance
+_SOURCE_CACHE_SIZE = 256
+
+# Leading bytes checked for NUL before a file is handed to an external scanner
+_BINARY_SNIFF_SIZE = 65536
+
+# Fewest files for which automatic parallelism (jobs == 0) starts a pool;
+# below this, worker start-up costs more than the pool saves
+_AUTO_PARALLEL_MIN_FILES = 64
+
+# Per-process YAMLGuard instance used by pool workers (set by _init_worker)
+_worker_guard: Optional["YAMLGuard"] = None
+
+
+def _init_worker(config: Config) -> None:
+    """Build the YAMLGuard instance shared by all tasks in a pool worker."""
+    global _worker_guard
+    _worker_guard = YAMLGuard(config=config)
+
+
+def _run_in_worker(method: str, file_path: Path) -> Dict[str, Any]:
+    """Run a per-file YAMLGuard method inside a pool worker."""
+    return getattr(_worker_guard, method)(file_path)
+
+
+def _load_source(file_path: Path) -> Tuple[int, int, str]:
+    """Stat and read a file, returning a source cache entry."""
+    stat = file_path.stat()
+    return stat.st_mtime_ns, stat.st_size, read_source(file_path)
+
+
+def _path_kind(path: Path) -> Literal['file', 'dir', 'missing']:
+    """Classify an input path with a single stat call."""
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        return 'missing'
+    
+    if S_ISREG(mode):
+        return 'file'
+    if S_ISDIR(mode):
+        return 'dir'
+    return 'missing'
+
+
+def _looks_binary(file_path: Path) -> bool:
+    """Whether a file has NUL bytes near its start, as binary files do."""
+    try:
+        with open(file_path, 'rb') as f:
+            return b'\0' in f.read(_BINARY_SNIFF_SIZE)
+    except OSError:
+        # Let the scanners report unreadable files
+        return False
+
+
+def _write_fixed(file_path: Path, fixed_content: str, content: str, backup: bool) -> None:
+    """
+    Replace a file's content atomically, optionally keeping a .bak copy.
+    
+    The fixed text goes to a temporary file next to the target and is moved
+    over it with os.replace, so an interrupted run never leaves a truncated
+    file behind. The backup is a hard link to the original inode where the
+    filesystem allows it, which saves writing the old content out again.
+    
+    Args:
+        file_path: File to update
+        fixed_content: New content
+        content: Original content, written out if the backup cannot be linked
+        backup: Whether to keep the original as <name>.bak
+    """
+    # Write through symlinks rather than replacing them with regular files
+    target = Path(os.path.realpath(file_path))
+    
+    if backup:
+        backup_path = file_path.with_suffix(f'{file_path.suffix}.bak')
+        try:
+            backup_path.unlink(missing_ok=True)
+            os.link(target, backup_path)
+        except OSError:
+            with open(backup_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+    
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(fixed_content)
+        os.chmod(tmp_path, os.stat(target).st_mode & 0o7777)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _glob_regex(pattern: str) -> str:
+    """
+    Translate a glob pattern into a regex over '/'-separated relative paths.
+    
+    '*', '?' and character classes stay within one path component, while
+    '**/' matches any number of leading directories and a trailing '**'
+    matches everything below a directory.
+    
+    Args:
+        pattern: Glob pattern from the include or exclude settings
+        
+    Returns:
+        Regex source for the pattern
+    """
+    parts = []
+    i, n = 0, len(pattern)
+    
+    while i < n:
+        if pattern.startswith('**/', i):
+            parts.append('(?:.*/)?')
+            i += 3
+            continue
+        if pattern.startswith('**', i):
+            parts.append('.*')
+            i += 2
+            continue
+        
+        char = pattern[i]
+        i += 1
+        if char == '*':
+            parts.append('[^/]*')
+        elif char == '?':
+            parts.append('[^/]')
+        elif char == '[':
+            # As in fnmatch, a ']' right after '[' or '[!' is literal
+            end = i + 1 if pattern.startswith('!', i) else i
+            end = pattern.find(']', end + 1 if pattern.startswith(']', end) else end)
+            if end < 0:
+                parts.append('\\[')
+                continue
+            body = pattern[i:end].replace('\\', '\\\\')
+            if body.startswith('!'):
+                body = '^' + body[1:]
+            elif body.startswith('^'):
+                body = '\\' + body
+            parts.append(f'[{body}]')
+            i = end + 1
+        else:
+            parts.append(re.escape(char))
+    
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=32)
+def _file_matchers(include: Tuple[str, ...],
+                   exclude: Tuple[str, ...]) -> Tuple[Pattern[str], Optional[Pattern[str]], Optional[Pattern[str]]]:
+    """
+    Compile the include and exclude settings for _find_yaml_files.
+    
+    Args:
+        include: Include glob patterns
+        exclude: Exclude glob patterns
+        
+    Returns:
+        Tuple of (include, exclude, prune) regexes. The include regex has
+        one named group per pattern so a match tells which pattern hit.
+        The prune regex matches directories whose whole subtree is excluded
+        by a pattern ending in '/**'; it and the exclude regex are None
+        when there is nothing to test.
+    """
+    include_re = re.compile('|'.join(
+        f'(?P<p{i}>{_glob_regex(pattern)})' for i, pattern in enumerate(include)
+    ) or '(?!)')
+    
+    # Exclude patterns are anchored at a path component boundary on the left,
+    # so relative patterns like '*.bak.yaml' apply at any depth
+    exclude_re = prune_re = None
+    if exclude:
+        exclude_re = re.compile('(?:^|/)(?:%s)$' % '|'.join(_glob_regex(p) for p in exclude))
+    subtrees = [p[:-3] for p in exclude if p.endswith('/**')]
+    if subtrees:
+        prune_re = re.compile('(?:^|/)(?:%s)$' % '|'.join(_glob_regex(p) for p in subtrees))
+    
+    return include_re, exclude_re, prune_re
+
 
 class YAMLGuard:
     """
@@ -46,23 +232,112 @@ class YAMLGuard:
             strict=self.config.cosmetics.enabled
         )
         
-        self.kube_validator = KubernetesValidator(
-            version=self.config.kubernetes.version,
-            use_kubeconform=self.config.kubernetes.use_kubeconform,
-            strict=self.config.kubernetes.strict
-        )
+        # Source text shared by the lint, validate and scan passes
+        self._source_cache: Dict[str, Tuple[int, int, str]] = {}
+        
+        # Persistent results for unchanged files, when configured
+        self.result_cache = ResultCache(self.config.cache_dir) if self.config.cache_dir else None
+    
+    @cached_property
+    def _lint_fingerprint(self) -> str:
+        """Identifies the lint settings in result cache keys."""
+        from yamlguard import __version__
+        
+        return (f"lint:{__version__}:{self.config.indent.model_dump_json()}:"
+                f"{self.config.cosmetics.model_dump_json()}")
+    
+    @cached_property
+    def _kube_fingerprint(self) -> str:
+        """Identifies the validation settings in result cache keys."""
+        from yamlguard import __version__
+        
+        # Whether kubeconform actually runs changes the findings as much as
+        # the settings do
+        return (f"kube:{__version__}:{self.config.kubernetes.model_dump_json()}:"
+                f"{self.kube_validator.kubeconform_available}")
+    
+    @cached_property
+    def _secrets_fingerprint(self) -> str:
+        """Identifies the native secrets scan settings in result cache keys."""
+        from yamlguard import __version__
+        
+        return f"secrets:{__version__}:{self.config.secrets.model_dump_json()}"
+    
+    def _cache_lookup(self, content: str, fingerprint: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Look up cached findings for file content.
         
-        self.secrets_engine = SecretsRuleEngine(
+        Args:
+            content: File content
+            fingerprint: Settings fingerprint of the check
+            
+        Returns:
+            Tuple of (cache key, cached findings); both are None when the
+            result cache is disabled, and the findings are None on a miss
+        """
+        if self.result_cache is None:
+            return None, None
+        
+        cache_key = self.result_cache.key(content, fingerprint)
+        return cache_key, self.result_cache.get(cache_key)
+    
+    @staticmethod
+    def _cached_result(file_path: Path, cached: Dict[str, Any], start_time: float) -> Dict[str, Any]:
+        """Build a per-file result from cached findings."""
+        return {
+            'file_path': str(file_path),
+            'success': len(cached['errors']) == 0,
+            'errors': cached['errors'],
+            'warnings': cached['warnings'],
+            'info': cached['info'],
+            'duration': time.perf_counter() - start_time
+        }
+    
+    @cached_property
+    def secrets_engine(self) -> SecretsRuleEngine:
+        """Native secrets rules engine, built on first use."""
+        return SecretsRuleEngine(
             entropy_threshold=self.config.secrets.entropy_threshold
         )
+    
+    @cached_property
+    def detect_secrets_adapter(self) -> DetectSecretsAdapter:
+        """
+        detect-secrets adapter, built on first use.
         
-        self.detect_secrets_adapter = DetectSecretsAdapter(
+        Construction runs `detect-secrets --version` to check availability,
+        so lint and validate runs never spawn it.
+        """
+        return DetectSecretsAdapter(
             baseline_file=self.config.secrets.baseline
         )
+    
+    @cached_property
+    def gitleaks_adapter(self) -> GitleaksAdapter:
+        """gitleaks adapter, built on first use (probes `gitleaks version`)."""
+        return GitleaksAdapter()
+    
+    @cached_property
+    def yaml_loader(self) -> YAMLLoader:
+        """YAML loader with position tracking, built on first use."""
+        return YAMLLoader()
+    
+    @cached_property
+    def kube_validator(self) -> "KubernetesValidator":
+        """
+        Kubernetes validator, imported and built on first use.
         
-        self.gitleaks_adapter = GitleaksAdapter()
+        The kube package pulls in jsonschema and requests, and the validator
+        probes for the kubeconform binary, so runs that never validate
+        manifests skip all of it.
+        """
+        from yamlguard.kube import KubernetesValidator
         
-        self.yaml_loader = YAMLLoader()
+        return KubernetesValidator(
+            version=self.config.kubernetes.version,
+            use_kubeconform=self.config.kubernetes.use_kubeconform,
+            strict=self.config.kubernetes.strict
+        )
     
     def lint_files(self, paths: List[Union[str, Path]]) -> List[Dict[str, Any]]:
         """
@@ -74,24 +349,43 @@ class YAMLGuard:
         Returns:
             List of validation results
         """
-        results = []
+        return self._process_files(paths, '_lint_file')
+    
+    def _process_files(self, paths: List[Union[str, Path]], method: str) -> List[Dict[str, Any]]:
+        """
+        Expand input paths and run a per-file method over every YAML file.
+        
+        Files are dispatched to a worker pool when jobs asks for one, or
+        automatically for large runs; results are returned in input order
+        either way.
+        
+        Args:
+            paths: List of file or directory paths
+            method: Name of the per-file method (e.g. '_lint_file')
+            
+        Returns:
+            List of validation results
+        """
+        # Expand directories, keeping missing paths as ready-made results
+        entries: List[Union[Path, Dict[str, Any]]] = []
+        found: Set[str] = set()
         
         for path in paths:
             path = Path(path)
-            
-            if path.is_file():
-                # Lint single file
-                result = self._lint_file(path)
-                results.append(result)
-            elif path.is_dir():
-                # Lint directory
-                yaml_files = self._find_yaml_files(path)
-                for yaml_file in yaml_files:
-                    result = self._lint_file(yaml_file)
-                    results.append(result)
+            kind = _path_kind(path)
+            
+            if kind == 'file':
+                # Keyed like _find_yaml_files, so a file is processed once
+                # however many arguments reach it
+                key = os.path.abspath(path)
+                if key not in found:
+                    found.add(key)
+                    entries.append(path)
+            elif kind == 'dir':
+                entries.extend(self._find_yaml_files(path, found))
             else:
                 # Path doesn't exist
-                results.append({
+                entries.append({
                     'file_path': str(path),
                     'success': False,
                     'errors': [{'message': f'File not found: {path}', 'severity': 'error'}],
@@ -100,8 +394,88 @@ class YAMLGuard:
                     'duration': 0.0
                 })
         
+        files = [entry for entry in entries if isinstance(entry, Path)]
+        file_results = iter(self._map_files(method, files))
+        
+        return [next(file_results) if isinstance(entry, Path) else entry for entry in entries]
+    
+    def _map_files(self, method: str, files: List[Path]) -> List[Dict[str, Any]]:
+        """
+        Run a per-file method over files, in parallel when worthwhile.
+        
+        Args:
+            method: Name of the per-file method
+            files: Files to process
+            
+        Returns:
+            Per-file results in the same order as files
+        """
+        if self.config.jobs:
+            workers = min(self.config.jobs, len(files))
+        elif len(files) >= _AUTO_PARALLEL_MIN_FILES:
+            workers = min(os.cpu_count() or 1, len(files))
+        else:
+            workers = 1
+        
+        if workers <= 1:
+            return self._map_files_serial(method, files)
+        
+        if method == '_scan_secrets_file' and self._uses_external_scanners():
+            # The scan is spent waiting on gitleaks/detect-secrets subprocesses
+            # with the GIL released, so threads sharing this instance scale
+            # without the start-up and pickling cost of worker processes
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(getattr(self, method), files))
+        
+        # A few chunks per worker keeps IPC low while still balancing load
+        chunksize = max(1, len(files) // (4 * workers))
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.config,)) as executor:
+            return list(executor.map(partial(_run_in_worker, method), files,
+                                     chunksize=chunksize))
+    
+    def _map_files_serial(self, method: str, files: List[Path]) -> List[Dict[str, Any]]:
+        """
+        Run a per-file method over files one at a time.
+        
+        The next file is read on a background thread while the current one
+        is checked, so disk latency overlaps with checker CPU time.
+        
+        Args:
+            method: Name of the per-file method
+            files: Files to process
+            
+        Returns:
+            Per-file results in the same order as files
+        """
+        run = getattr(self, method)
+        
+        if len(files) < 2:
+            return [run(file_path) for file_path in files]
+        
+        results = []
+        with ThreadPoolExecutor(max_workers=1) as reader:
+            pending = reader.submit(_load_source, files[0])
+            
+            for i, file_path in enumerate(files):
+                try:
+                    self._cache_source(str(file_path), pending.result())
+                except Exception:
+                    # The per-file method reads again and reports the error
+                    pass
+                
+                if i + 1 < len(files):
+                    pending = reader.submit(_load_source, files[i + 1])
+                
+                results.append(run(file_path))
+        
         return results
     
+    def _uses_external_scanners(self) -> bool:
+        """Whether secrets scanning delegates to external tools."""
+        return self.config.secrets.use_detect_secrets or self.config.secrets.use_gitleaks
+    
     def _lint_file(self, file_path: Path) -> Dict[str, Any]:
         """
         Lint a single YAML file.
@@ -112,48 +486,59 @@ class YAMLGuard:
         Returns:
             Validation result dictionary
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
+            content = self._read_source(file_path)
+            
+            cache_key, cached = self._cache_lookup(content, self._lint_fingerprint)
+            if cached is not None:
+                return self._cached_result(file_path, cached, start_time)
+            
             # Check indentation
-            indent_errors = self.indent_checker.check_file(file_path)
+            indent_errors = self.indent_checker.check_content(content, str(file_path))
             
             # Check cosmetics
-            cosmetics_errors = self.cosmetics_checker.check_file(file_path)
+            cosmetics_errors = self.cosmetics_checker.check_content(content, str(file_path))
             
-            # Combine errors
-            all_errors = []
+            # Collect findings straight into per-severity lists
+            errors = []
+            warnings = []
+            info = []
+            buckets = {'error': errors, 'warning': warnings, 'info': info}
             
             # Add indentation errors
             for error in indent_errors:
-                all_errors.append({
-                    'type': 'indentation',
-                    'line': error.line,
-                    'column': error.column,
-                    'rule': 'indentation',
-                    'message': error.message,
-                    'severity': error.severity,
-                    'path': error.path
-                })
+                bucket = buckets.get(error.severity)
+                if bucket is not None:
+                    bucket.append({
+                        'type': 'indentation',
+                        'line': error.line,
+                        'column': error.column,
+                        'rule': 'indentation',
+                        'message': error.message,
+                        'severity': error.severity,
+                        'path': error.path
+                    })
             
             # Add cosmetics errors
             for error in cosmetics_errors:
-                all_errors.append({
-                    'type': 'cosmetics',
-                    'line': error.line,
-                    'column': error.column,
-                    'rule': error.rule,
-                    'message': error.message,
-                    'severity': error.severity,
-                    'path': ''
-                })
+                bucket = buckets.get(error.severity)
+                if bucket is not None:
+                    bucket.append({
+                        'type': 'cosmetics',
+                        'line': error.line,
+                        'column': error.column,
+                        'rule': error.rule,
+                        'message': error.message,
+                        'severity': error.severity,
+                        'path': ''
+                    })
             
-            # Categorize errors
-            errors = [e for e in all_errors if e['severity'] == 'error']
-            warnings = [e for e in all_errors if e['severity'] == 'warning']
-            info = [e for e in all_errors if e['severity'] == 'info']
+            if cache_key is not None:
+                self.result_cache.put(cache_key, {'errors': errors, 'warnings': warnings, 'info': info})
             
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             return {
                 'file_path': str(file_path),
@@ -165,7 +550,7 @@ class YAMLGuard:
             }
             
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             return {
                 'file_path': str(file_path),
                 'success': False,
@@ -185,33 +570,7 @@ class YAMLGuard:
         Returns:
             List of validation results
         """
-        results = []
-        
-        for path in paths:
-            path = Path(path)
-            
-            if path.is_file():
-                # Validate single file
-                result = self._kube_validate_file(path)
-                results.append(result)
-            elif path.is_dir():
-                # Validate directory
-                yaml_files = self._find_yaml_files(path)
-                for yaml_file in yaml_files:
-                    result = self._kube_validate_file(yaml_file)
-                    results.append(result)
-            else:
-                # Path doesn't exist
-                results.append({
-                    'file_path': str(path),
-                    'success': False,
-                    'errors': [{'message': f'File not found: {path}', 'severity': 'error'}],
-                    'warnings': [],
-                    'info': [],
-                    'duration': 0.0
-                })
-        
-        return results
+        return self._process_files(paths, '_kube_validate_file')
     
     def _kube_validate_file(self, file_path: Path) -> Dict[str, Any]:
         """
@@ -223,19 +582,26 @@ class YAMLGuard:
         Returns:
             Validation result dictionary
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
+            content = self._read_source(file_path)
+            
+            cache_key, cached = self._cache_lookup(content, self._kube_fingerprint)
+            if cached is not None:
+                return self._cached_result(file_path, cached, start_time)
+            
             # Validate with Kubernetes validator
-            kube_errors = self.kube_validator.validate_file(file_path)
+            kube_errors = self.kube_validator.validate_content(content, str(file_path))
             
-            # Convert to our format
+            # Convert to our format, anything below warning counts as info
             errors = []
             warnings = []
             info = []
+            buckets = {'error': errors, 'warning': warnings}
             
             for error in kube_errors:
-                error_dict = {
+                buckets.get(error.severity, info).append({
                     'type': 'kubernetes',
                     'line': error.line,
                     'column': error.column,
@@ -243,16 +609,12 @@ class YAMLGuard:
                     'message': error.message,
                     'severity': error.severity,
                     'path': error.path
-                }
-                
-                if error.severity == 'error':
-                    errors.append(error_dict)
-                elif error.severity == 'warning':
-                    warnings.append(error_dict)
-                else:
-                    info.append(error_dict)
+                })
+            
+            if cache_key is not None:
+                self.result_cache.put(cache_key, {'errors': errors, 'warnings': warnings, 'info': info})
             
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             return {
                 'file_path': str(file_path),
@@ -264,7 +626,7 @@ class YAMLGuard:
             }
             
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             return {
                 'file_path': str(file_path),
                 'success': False,
@@ -284,33 +646,7 @@ class YAMLGuard:
         Returns:
             List of validation results
         """
-        results = []
-        
-        for path in paths:
-            path = Path(path)
-            
-            if path.is_file():
-                # Scan single file
-                result = self._scan_secrets_file(path)
-                results.append(result)
-            elif path.is_dir():
-                # Scan directory
-                yaml_files = self._find_yaml_files(path)
-                for yaml_file in yaml_files:
-                    result = self._scan_secrets_file(yaml_file)
-                    results.append(result)
-            else:
-                # Path doesn't exist
-                results.append({
-                    'file_path': str(path),
-                    'success': False,
-                    'errors': [{'message': f'File not found: {path}', 'severity': 'error'}],
-                    'warnings': [],
-                    'info': [],
-                    'duration': 0.0
-                })
-        
-        return results
+        return self._process_files(paths, '_scan_secrets_file')
     
     def _scan_secrets_file(self, file_path: Path) -> Dict[str, Any]:
         """
@@ -322,19 +658,29 @@ class YAMLGuard:
         Returns:
             Validation result dictionary
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Use different scanners based on configuration
             all_secrets = []
+            cache_key = None
             
             # Use native rules engine
             if not self.config.secrets.use_detect_secrets and not self.config.secrets.use_gitleaks:
-                secrets = self.secrets_engine.scan_file(file_path)
+                content = self._read_source(file_path)
+                
+                cache_key, cached = self._cache_lookup(content, self._secrets_fingerprint)
+                if cached is not None:
+                    return self._cached_result(file_path, cached, start_time)
+                
+                secrets = self.secrets_engine.scan_content(content, str(file_path))
                 all_secrets.extend(secrets)
             
+            # A binary file is not YAML and cannot be worth a scanner subprocess
+            external = self._uses_external_scanners() and not _looks_binary(file_path)
+            
             # Use detect-secrets if configured
-            if self.config.secrets.use_detect_secrets and self.detect_secrets_adapter.available:
+            if external and self.config.secrets.use_detect_secrets and self.detect_secrets_adapter.available:
                 try:
                     secrets = self.detect_secrets_adapter.scan_file(file_path)
                     all_secrets.extend(secrets)
@@ -345,7 +691,7 @@ class YAMLGuard:
                     })
             
             # Use gitleaks if configured
-            if self.config.secrets.use_gitleaks and self.gitleaks_adapter.available:
+            if external and self.config.secrets.use_gitleaks and self.gitleaks_adapter.available:
                 try:
                     secrets = self.gitleaks_adapter.scan_file(file_path)
                     all_secrets.extend(secrets)
@@ -355,41 +701,35 @@ class YAMLGuard:
                         'severity': 'error'
                     })
             
-            # Convert to our format
+            # Convert to our format, anything below warning counts as info
             errors = []
             warnings = []
             info = []
+            buckets = {'error': errors, 'warning': warnings}
             
             for secret in all_secrets:
-                if hasattr(secret, 'dict'):
-                    # It's a SecretMatch object
-                    secret_dict = secret.dict()
-                elif hasattr(secret, 'to_dict'):
-                    # It's a SecretMatch object
-                    secret_dict = secret.to_dict()
-                else:
-                    # It's already a dictionary
-                    secret_dict = secret
+                # Read fields straight off SecretMatch objects rather than
+                # dumping each one to an intermediate dict first
+                get = secret.get if isinstance(secret, dict) else partial(getattr, secret)
                 
-                error_dict = {
+                severity = get('severity', 'error')
+                buckets.get(severity, info).append({
                     'type': 'secrets',
-                    'line': secret_dict.get('line', 0),
-                    'column': secret_dict.get('column', 0),
-                    'rule': secret_dict.get('rule', 'unknown'),
-                    'message': secret_dict.get('message', 'Unknown secret'),
-                    'severity': secret_dict.get('severity', 'error'),
-                    'path': secret_dict.get('path', ''),
-                    'context': secret_dict.get('context', '')
-                }
-                
-                if error_dict['severity'] == 'error':
-                    errors.append(error_dict)
-                elif error_dict['severity'] == 'warning':
-                    warnings.append(error_dict)
-                else:
-                    info.append(error_dict)
+                    'line': get('line', 0),
+                    'column': get('column', 0),
+                    'rule': get('rule', 'unknown'),
+                    'message': get('message', 'Unknown secret'),
+                    'severity': severity,
+                    'path': get('path', ''),
+                    'context': get('context', '')
+                })
+            
+            # Only clean scans are cached, so findings and the context lines
+            # around detected secrets are never copied into the cache directory
+            if cache_key is not None and not all_secrets:
+                self.result_cache.put(cache_key, {'errors': [], 'warnings': [], 'info': []})
             
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             return {
                 'file_path': str(file_path),
@@ -401,7 +741,7 @@ class YAMLGuard:
             }
             
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             return {
                 'file_path': str(file_path),
                 'success': False,
@@ -425,17 +765,19 @@ class YAMLGuard:
             List of fix results
         """
         results = []
+        found: Set[str] = set()
         
         for path in paths:
             path = Path(path)
+            kind = _path_kind(path)
             
-            if path.is_file():
+            if kind == 'file':
                 # Fix single file
                 result = self._fix_file(path, in_place, backup)
                 results.append(result)
-            elif path.is_dir():
+            elif kind == 'dir':
                 # Fix directory
-                yaml_files = self._find_yaml_files(path)
+                yaml_files = self._find_yaml_files(path, found)
                 for yaml_file in yaml_files:
                     result = self._fix_file(yaml_file, in_place, backup)
                     results.append(result)
@@ -463,8 +805,7 @@ class YAMLGuard:
         """
         try:
             # Read file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read_source(file_path)
             
             # Fix indentation
             fixed_content = self.indent_checker.fix_indentation(content, self.config.indent.step)
@@ -472,21 +813,18 @@ class YAMLGuard:
             # Fix cosmetics
             fixed_content = self.cosmetics_checker.fix_cosmetics(fixed_content)
             
+            # Clean files are left untouched: no write, no backup
+            changed = fixed_content != content
+            
             if in_place:
-                # Create backup if requested
-                if backup:
-                    backup_path = file_path.with_suffix(f'{file_path.suffix}.bak')
-                    with open(backup_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
-                
-                # Write fixed content
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(fixed_content)
+                if changed:
+                    _write_fixed(file_path, fixed_content, content, backup)
                 
                 return {
                     'file': str(file_path),
                     'success': True,
-                    'error': None
+                    'error': None,
+                    'changed': changed
                 }
             else:
                 # Return fixed content
@@ -494,6 +832,7 @@ class YAMLGuard:
                     'file': str(file_path),
                     'success': True,
                     'error': None,
+                    'changed': changed,
                     'content': fixed_content
                 }
                 
@@ -504,44 +843,96 @@ class YAMLGuard:
                 'error': str(e)
             }
     
-    def _find_yaml_files(self, directory: Path) -> List[Path]:
+    def _read_source(self, file_path: Path) -> str:
+        """
+        Read a file, reusing the text from an earlier pass if it is unchanged.
+        
+        Entries are keyed by path and checked against (mtime_ns, size) so
+        that edits between passes are picked up.
+        
+        Args:
+            file_path: Path to the YAML file
+            
+        Returns:
+            File content
+        """
+        stat = file_path.stat()
+        key = str(file_path)
+        
+        cached = self._source_cache.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        
+        content = read_source(file_path)
+        self._cache_source(key, (stat.st_mtime_ns, stat.st_size, content))
+        return content
+    
+    def _cache_source(self, key: str, entry: Tuple[int, int, str]) -> None:
+        """Store a (mtime_ns, size, content) source entry, evicting the oldest when full."""
+        if key not in self._source_cache and len(self._source_cache) >= _SOURCE_CACHE_SIZE:
+            # Evict the oldest entry
+            del self._source_cache[next(iter(self._source_cache))]
+        
+        self._source_cache[key] = entry
+    
+    def _find_yaml_files(self, directory: Path, seen: Optional[Set[str]] = None) -> List[Path]:
         """
         Find YAML files in a directory.
         
+        The tree is walked once and every path is tested against compiled
+        include and exclude patterns. Directories excluded as a whole (such
+        as '**/node_modules/**') are not descended into.
+        
         Args:
             directory: Directory to search
+            seen: Absolute paths already found by earlier calls (skipped, updated in place)
             
         Returns:
-            List of YAML file paths
-        """
-        yaml_files = []
-        
-        # Get include patterns
-        include_patterns = self.config.include
-        exclude_patterns = self.config.exclude
-        
-        # Find files matching include patterns
-        for pattern in include_patterns:
-            if pattern.startswith('**/'):
-                # Recursive pattern
-                pattern = pattern[3:]  # Remove '**/'
-                for file_path in directory.rglob(pattern):
-                    if file_path.is_file():
-                        yaml_files.append(file_path)
-            else:
-                # Non-recursive pattern
-                for file_path in directory.glob(pattern):
-                    if file_path.is_file():
-                        yaml_files.append(file_path)
-        
-        # Remove files matching exclude patterns
-        for pattern in exclude_patterns:
-            if pattern.startswith('**/'):
-                # Recursive pattern
-                pattern = pattern[3:]  # Remove '**/'
-                yaml_files = [f for f in yaml_files if not f.match(pattern)]
-            else:
-                # Non-recursive pattern
-                yaml_files = [f for f in yaml_files if not f.match(pattern)]
+            List of YAML file paths, grouped by the include pattern they match
+        """
+        include_re, exclude_re, prune_re = _file_matchers(
+            tuple(self.config.include), tuple(self.config.exclude)
+        )
+        matched: List[List[Path]] = [[] for _ in self.config.include]
+        
+        # Dedup keys are built from the normalized top directory and the
+        # relative path, which needs no per-file syscall
+        top = os.path.abspath(directory) + os.sep
+        
+        # Depth-first in directory order, like os.walk, but DirEntry keeps the
+        # file type from the directory listing so most files need no stat
+        stack = [(str(directory), '')]
+        while stack:
+            path, prefix = stack.pop()
+            try:
+                with os.scandir(path) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            
+            subdirs = []
+            for entry in entries:
+                rel_path = prefix + entry.name
+                
+                if entry.is_dir(follow_symlinks=False):
+                    if prune_re is None or not prune_re.search(rel_path):
+                        subdirs.append((entry.path, rel_path + '/'))
+                    continue
+                
+                match = include_re.fullmatch(rel_path)
+                if match is None or (exclude_re is not None and exclude_re.search(rel_path)):
+                    continue
+                
+                if seen is not None:
+                    key = top + rel_path
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                
+                # Follows symlinks, skipping broken ones and special files
+                if entry.is_file():
+                    matched[int(match.lastgroup[1:])].append(Path(entry.path))
+            
+            stack.extend(reversed(subdirs))
         
-        return yaml_files
+        return [file_path for group in matched for file_path in group]
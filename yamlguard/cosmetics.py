@@ -7,15 +7,64 @@ and other YAML style issues that complement indentation checking.
 
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
+import yaml
 from ruamel.yaml import YAML
-from ruamel.yaml.comments import CommentedMap, CommentedSeq
+from ruamel.yaml import nodes as ruamel_nodes
+from yaml import nodes as yaml_nodes
+
+from yamlguard.loader import SafeLoader, read_source
+
+
+# Node classes of both composers used by the duplicate-key check
+_MAPPING_NODES = (yaml_nodes.MappingNode, ruamel_nodes.MappingNode)
+_SEQUENCE_NODES = (yaml_nodes.SequenceNode, ruamel_nodes.SequenceNode)
+_SCALAR_NODES = (yaml_nodes.ScalarNode, ruamel_nodes.ScalarNode)
+_COLLECTION_NODES = _MAPPING_NODES + _SEQUENCE_NODES
+
+try:
+    from yaml.cyaml import CParser
+except ImportError:
+    # Pure-Python PyYAML: compose with the regular loader
+    _NodeLoader = SafeLoader
+else:
+    class _NodeLoader(CParser):
+        """
+        LibYAML composer that leaves node tags unresolved.
+        
+        PyYAML resolves the implicit tag of every node in Python even when
+        libyaml does the parsing, which is most of the cost of composing.
+        The duplicate-key walk reads only node values and marks.
+        """
+        
+        def descend_resolver(self, current_node: Any, current_index: Any) -> None:
+            pass
+        
+        def ascend_resolver(self) -> None:
+            pass
+        
+        def resolve(self, kind: type, value: Any, implicit: Any) -> None:
+            return None
+
+# A BOM at the start of a line, removed by fix_cosmetics
+_LINE_START_BOM = re.compile('^\ufeff', re.MULTILINE)
+
+# Canonical boolean spellings, each matched case-insensitively at the start
+# of a value by the group of the same position in _BOOLEAN_VALUE
+_BOOLEAN_CANONICAL = ('true', 'false', 'yes', 'no', 'on', 'off')
+_BOOLEAN_VALUE = re.compile(
+    '(?:' + '|'.join(f'({word})' for word in _BOOLEAN_CANONICAL) + r')\b',
+    re.IGNORECASE
+)
 
 
 class CosmeticsError:
     """Represents a cosmetics error with detailed information."""
     
+    # Reports can hold thousands of these, so skip the per-instance __dict__
+    __slots__ = ('line', 'column', 'rule', 'message', 'severity', 'fix')
+    
     def __init__(self, line: int, column: int, rule: str, message: str, 
                  severity: str = "warning", fix: Optional[str] = None):
         """
@@ -72,6 +121,7 @@ class CosmeticsChecker:
         self.line_length = line_length
         self.strict = strict
         self.errors: List[CosmeticsError] = []
+        self.errors_by_rule: Dict[str, List[CosmeticsError]] = {}
     
     def check_file(self, file_path: Union[str, Path]) -> List[CosmeticsError]:
         """
@@ -88,9 +138,8 @@ class CosmeticsChecker:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            return self.check_content(content, str(file_path))
+        # Shares the mmap-backed reader used by YAMLGuard for large files
+        return self.check_content(read_source(file_path), str(file_path))
     
     def check_content(self, content: str, source: str = "<string>") -> List[CosmeticsError]:
         """
@@ -101,54 +150,96 @@ class CosmeticsChecker:
             source: Source identifier for error reporting
             
         Returns:
-            List of cosmetics errors found
+            List of cosmetics errors found; errors_by_rule holds the same
+            errors grouped by rule name
         """
         self.errors = []
+        self.errors_by_rule = {}
         
         # Check line-by-line issues
-        self._check_trailing_spaces(content, source)
-        self._check_tabs(content, source)
-        self._check_bom(content, source)
-        self._check_line_length(content, source)
+        value_lines = self._check_lines(content, source)
         
         # Check YAML structure issues
         self._check_duplicate_keys(content, source)
-        self._check_quotes(content, source)
-        self._check_booleans(content, source)
+        self._check_quotes(value_lines, source)
+        self._check_booleans(value_lines, source)
         
         return self.errors
     
-    def _check_trailing_spaces(self, content: str, source: str) -> None:
-        """Check for trailing spaces."""
-        lines = content.splitlines()
+    def _check_lines(self, content: str, source: str) -> List[Tuple[int, str]]:
+        """
+        Check trailing spaces, tabs, BOM and line length in a single pass.
+        
+        The lines are walked once and findings are buffered per rule so they
+        are reported in the same order as separate per-rule passes would.
         
-        for i, line in enumerate(lines, 1):
-            if line.endswith(' ') or line.endswith('\t'):
+        Returns:
+            Numbered lines containing a colon, for the value checks
+        """
+        trailing = []
+        tabs = []
+        long_lines = []
+        value_lines = []
+        line_length = self.line_length
+        
+        # The BOM is a single-character check; keep it out of the line scan
+        # so it does not shift the first line's columns and length
+        has_bom = content.startswith('\ufeff')
+        text = content[1:] if has_bom else content
+        
+        # Whole-buffer scans in C decide which per-line checks can hit at all.
+        # The loop body sticks to str methods (endswith, find, len) which run
+        # in C; splitting the rules into separate comprehensions, or finding
+        # tabs and trailing whitespace with one multiline re.finditer over
+        # the buffer, both measured slower than this single loop.
+        check_tabs = '\t' in text
+        check_length = len(text) > line_length
+        
+        for i, line in enumerate(text.splitlines(), 1):
+            if line.endswith((' ', '\t')):
                 # Find the last non-whitespace character
                 stripped = line.rstrip()
                 if stripped:  # Don't flag empty lines
-                    column = len(stripped) + 1
-                    self._add_error(
-                        i, column, 'trailing-spaces',
-                        f"Trailing spaces found at end of line",
-                        "warning",
-                        stripped
-                    )
-    
-    def _check_tabs(self, content: str, source: str) -> None:
-        """Check for tab usage."""
-        lines = content.splitlines()
+                    trailing.append((i, stripped))
+            
+            if check_tabs:
+                tab_pos = line.find('\t')
+                if tab_pos != -1:
+                    tabs.append((i, tab_pos + 1, line))
+            
+            if check_length and len(line) > line_length:
+                long_lines.append((i, len(line)))
+            
+            if ':' in line:
+                value_lines.append((i, line))
         
-        for i, line in enumerate(lines, 1):
-            if '\t' in line:
-                # Find first tab
-                tab_pos = line.find('\t') + 1
-                self._add_error(
-                    i, tab_pos, 'tabs',
-                    f"Tab character found (use spaces instead)",
-                    "error",
-                    line.replace('\t', '    ')  # Replace tabs with 4 spaces
-                )
+        for i, stripped in trailing:
+            self._add_error(
+                i, len(stripped) + 1, 'trailing-spaces',
+                f"Trailing spaces found at end of line",
+                "warning",
+                stripped
+            )
+        
+        for i, tab_pos, line in tabs:
+            self._add_error(
+                i, tab_pos, 'tabs',
+                f"Tab character found (use spaces instead)",
+                "error",
+                line.replace('\t', '    ')  # Replace tabs with 4 spaces
+            )
+        
+        if has_bom:
+            self._check_bom(content, source)
+        
+        for i, length in long_lines:
+            self._add_error(
+                i, line_length + 1, 'line-length',
+                f"Line too long ({length} characters, max {line_length})",
+                "warning"
+            )
+        
+        return value_lines
     
     def _check_bom(self, content: str, source: str) -> None:
         """Check for BOM (Byte Order Mark) presence."""
@@ -160,116 +251,119 @@ class CosmeticsChecker:
                 content[1:]  # Remove BOM
             )
     
-    def _check_line_length(self, content: str, source: str) -> None:
-        """Check for overly long lines."""
-        lines = content.splitlines()
-        
-        for i, line in enumerate(lines, 1):
-            if len(line) > self.line_length:
-                self._add_error(
-                    i, self.line_length + 1, 'line-length',
-                    f"Line too long ({len(line)} characters, max {self.line_length})",
-                    "warning"
-                )
-    
     def _check_duplicate_keys(self, content: str, source: str) -> None:
         """Check for duplicate keys in YAML."""
+        # Walk the composed node tree: loaded mappings have already collapsed
+        # duplicate keys, while nodes keep every pair. Only structure is
+        # needed, so compose with libyaml rather than ruamel's pure-Python
+        # round-trip parser, and without resolving tags.
+        checked = 0
         try:
-            yaml = YAML()
-            yaml.allow_duplicate_keys = True  # Allow parsing with duplicates
-            
-            # Parse and check for duplicates
-            data = yaml.load(content)
-            self._find_duplicate_keys(data, [], source)
+            for document in yaml.compose_all(content, Loader=_NodeLoader):
+                self._find_duplicate_keys(document, [], source)
+                checked += 1
+        except yaml.composer.ComposerError as e:
+            if not (e.context or '').startswith('found duplicate anchor'):
+                return
             
+            # YAML 1.2 allows redefining an anchor but libyaml refuses it, so
+            # the remaining documents are composed by ruamel instead
+            try:
+                for i, document in enumerate(YAML().compose_all(content)):
+                    if i >= checked:
+                        self._find_duplicate_keys(document, [], source)
+            except Exception:
+                pass
         except Exception:
             # If parsing fails, skip duplicate key checking
             pass
     
-    def _find_duplicate_keys(self, obj: Any, path: List[str], source: str) -> None:
-        """Recursively find duplicate keys in YAML structure."""
-        if isinstance(obj, CommentedMap):
-            seen_keys: Set[str] = set()
-            
-            for key, value in obj.items():
-                key_str = str(key)
-                if key_str in seen_keys:
-                    # Found duplicate key
-                    self._add_error(
-                        1, 1, 'duplicate-key',
-                        f"Duplicate key '{key_str}' found at path {'.'.join(path)}",
-                        "error"
-                    )
-                else:
-                    seen_keys.add(key_str)
+    def _find_duplicate_keys(self, node: Any, path: List[str], source: str) -> None:
+        """
+        Recursively find duplicate keys in a YAML node tree.
+        
+        path is shared by the whole walk: each level appends its key before
+        descending and pops it afterwards, and scalar values are not visited.
+        """
+        if isinstance(node, _MAPPING_NODES):
+            # Keys only collide within the same mapping
+            seen: Set[str] = set()
+            for key_node, value_node in node.value:
+                key_str = str(key_node.value)
+                if isinstance(key_node, _SCALAR_NODES):
+                    if key_str in seen:
+                        # Found duplicate key
+                        self._add_error(
+                            key_node.start_mark.line + 1,
+                            key_node.start_mark.column + 1,
+                            'duplicate-key',
+                            f"Duplicate key '{key_str}' found at path {'.'.join(path) or 'root'}",
+                            "error"
+                        )
+                    else:
+                        seen.add(key_str)
                 
                 # Recursively check nested structures
-                self._find_duplicate_keys(value, path + [key_str], source)
+                if isinstance(value_node, _COLLECTION_NODES):
+                    path.append(key_str)
+                    self._find_duplicate_keys(value_node, path, source)
+                    path.pop()
                 
-        elif isinstance(obj, CommentedSeq):
-            for i, item in enumerate(obj):
-                self._find_duplicate_keys(item, path + [f"[{i}]"], source)
+        elif isinstance(node, _SEQUENCE_NODES):
+            for i, item in enumerate(node.value):
+                if isinstance(item, _COLLECTION_NODES):
+                    path.append(f"[{i}]")
+                    self._find_duplicate_keys(item, path, source)
+                    path.pop()
     
-    def _check_quotes(self, content: str, source: str) -> None:
+    def _check_quotes(self, value_lines: List[Tuple[int, str]], source: str) -> None:
         """Check for inconsistent quote usage."""
-        lines = content.splitlines()
-        
-        for i, line in enumerate(lines, 1):
+        for i, line in value_lines:
             # Check for mixed quotes in the same line
             if "'" in line and '"' in line:
-                # Look for potential string values
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    if value.strip().startswith(("'", '"')):
-                        self._add_error(
-                            i, 1, 'mixed-quotes',
-                            "Mixed quote usage found in same line",
-                            "info"
-                        )
+                # value_lines all contain a colon; slice past the first one
+                # rather than splitting the line into a new list
+                value = line[line.find(':') + 1:]
+                if value.lstrip().startswith(("'", '"')):
+                    self._add_error(
+                        i, 1, 'mixed-quotes',
+                        "Mixed quote usage found in same line",
+                        "info"
+                    )
     
-    def _check_booleans(self, content: str, source: str) -> None:
+    def _check_booleans(self, value_lines: List[Tuple[int, str]], source: str) -> None:
         """Check for inconsistent boolean representation."""
-        lines = content.splitlines()
-        
-        # Common boolean patterns
-        boolean_patterns = [
-            (r'\btrue\b', 'true'),
-            (r'\bfalse\b', 'false'),
-            (r'\byes\b', 'yes'),
-            (r'\bno\b', 'no'),
-            (r'\bon\b', 'on'),
-            (r'\boff\b', 'off'),
-        ]
-        
-        for i, line in enumerate(lines, 1):
-            for pattern, canonical in boolean_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    # Check if it's a value (after colon)
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        value = value.strip()
-                        if re.match(pattern, value, re.IGNORECASE):
-                            # Suggest canonical form
-                            suggested = line.replace(value, canonical)
-                            self._add_error(
-                                i, 1, 'boolean-format',
-                                f"Use canonical boolean format: {canonical}",
-                                "info",
-                                suggested
-                            )
+        for i, line in value_lines:
+            value = line.split(':', 1)[1].strip()
+            
+            # One alternation replaces a search per spelling: a value can
+            # only start with one of them
+            match = _BOOLEAN_VALUE.match(value)
+            if match:
+                canonical = _BOOLEAN_CANONICAL[match.lastindex - 1]
+                
+                # Suggest canonical form
+                suggested = line.replace(value, canonical)
+                self._add_error(
+                    i, 1, 'boolean-format',
+                    f"Use canonical boolean format: {canonical}",
+                    "info",
+                    suggested
+                )
     
     def _add_error(self, line: int, column: int, rule: str, message: str,
                    severity: str, fix: Optional[str] = None) -> None:
         """Add a cosmetics error to the list."""
-        error = CosmeticsError(
-            line=line,
-            column=column,
-            rule=rule,
-            message=message,
-            severity=severity,
-            fix=fix
-        )
+        # Positional arguments bind faster than keywords for every finding
+        error = CosmeticsError(line, column, rule, message, severity, fix)
         self.errors.append(error)
+        
+        # Index by rule as errors are emitted so callers need not filter
+        by_rule = self.errors_by_rule.get(rule)
+        if by_rule is None:
+            self.errors_by_rule[rule] = [error]
+        else:
+            by_rule.append(error)
     
     def fix_cosmetics(self, content: str) -> str:
         """
@@ -281,23 +375,23 @@ class CosmeticsChecker:
         Returns:
             Fixed YAML content
         """
-        lines = content.splitlines()
-        fixed_lines = []
+        # Remove trailing spaces; rstrip per line runs several times faster
+        # than a multiline re.sub, which tries a match at every blank
+        fixed = '\n'.join([line.rstrip() for line in content.splitlines()])
         
-        for line in lines:
-            # Remove trailing spaces
-            line = line.rstrip()
-            
-            # Replace tabs with spaces
-            line = line.replace('\t', '    ')
-            
-            # Remove BOM from first line
-            if line.startswith('\ufeff'):
-                line = line[1:]
-            
-            fixed_lines.append(line)
+        # splitlines() drops the final line break; keep the file's last newline
+        if content.endswith(('\n', '\r')):
+            fixed += '\n'
+        
+        # Replace tabs with spaces, over the whole buffer at once
+        if '\t' in fixed:
+            fixed = fixed.replace('\t', '    ')
+        
+        # Remove BOM from the start of any line
+        if '\ufeff' in fixed:
+            fixed = _LINE_START_BOM.sub('', fixed)
         
-        return '\n'.join(fixed_lines)
+        return fixed
     
     def get_rule_documentation(self) -> Dict[str, str]:
         """Get documentation for all cosmetic rules."""
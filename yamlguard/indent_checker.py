@@ -5,6 +5,7 @@ Provides precise indentation validation with tree walking and detailed
 error reporting including exact line/column positions and suggested fixes.
 """
 
+import io
 import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -12,10 +13,15 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 from ruamel.yaml import YAML
 from ruamel.yaml.tokens import Token
 
+from yamlguard.loader import read_source
+
 
 class IndentationError:
     """Represents an indentation error with detailed information."""
     
+    # Fixed attribute set, no per-instance __dict__
+    __slots__ = ('line', 'column', 'expected', 'actual', 'path', 'message', 'severity')
+    
     def __init__(self, line: int, column: int, expected: int, actual: int, 
                  path: str, message: str, severity: str = "error"):
         """
@@ -91,9 +97,7 @@ class IndentationChecker:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            return self.check_content(content, str(file_path))
+        return self.check_content(read_source(file_path), str(file_path))
     
     def check_content(self, content: str, source: str = "<string>") -> List[IndentationError]:
         """
@@ -108,20 +112,11 @@ class IndentationChecker:
         """
         self.errors = []
         
-        try:
-            # Parse with ruamel.yaml to get token-level information
-            yaml = YAML()
-            yaml.preserve_quotes = True
-            
-            # Parse to get tokens
-            tokens = list(yaml.parse(content))
-            
-            # Analyze indentation
-            self._analyze_tokens(tokens, content, source)
-            
-        except Exception as e:
-            # If parsing fails, fall back to line-by-line analysis
-            self._analyze_lines(content, source)
+        # YAML.parse yields events rather than the tokens _analyze_tokens
+        # expects, so a full ruamel parse here always ended in the
+        # line-by-line fallback. Go straight to it and leave the only YAML
+        # parse of a linted file to the cosmetics duplicate-key check.
+        self._analyze_lines(content, source)
         
         return self.errors
     
@@ -216,55 +211,73 @@ class IndentationChecker:
             source: Source identifier
         """
         lines = content.splitlines()
-        indent_stack = [0]
-        path_stack = []
+        
+        # Each sequence item or key opens a level one step below the last,
+        # so the levels seen so far are always 0, step, ..., top. They are
+        # kept in a set for the per-line membership test; scanning an
+        # ever-growing stack list made the whole scan quadratic. Nested
+        # keys are not tracked, so findings are at the root.
+        step = self.indent_step
+        top = 0
+        levels = {0}
+        add_level = levels.add
+        path = 'root'
         
         for i, line in enumerate(lines, 1):
-            if not line.strip():  # Skip empty lines
+            stripped = line.lstrip()
+            if not stripped:  # Skip empty lines
                 continue
             
             # Calculate actual indentation
-            actual_indent = len(line) - len(line.lstrip())
+            actual_indent = len(line) - len(stripped)
             
             # Check for sequence items
-            if line.strip().startswith('-'):
+            if stripped.startswith('-'):
                 # Sequence item
-                expected_indent = indent_stack[-1]
+                expected_indent = top
                 if actual_indent != expected_indent:
                     self._add_error(
                         i, actual_indent + 1, expected_indent + 1, actual_indent + 1,
-                        '.'.join(path_stack) if path_stack else 'root',
+                        path,
                         f"Sequence item indentation mismatch: expected {expected_indent + 1}, found {actual_indent + 1}",
                         source
                     )
                 
                 # Next level should be indented by indent_step
-                indent_stack.append(expected_indent + self.indent_step)
+                top = expected_indent + step
+                add_level(top)
                 
-            elif ':' in line and not line.strip().startswith('#'):
+            elif ':' in line and not stripped.startswith('#'):
                 # Potential mapping key
-                key_part = line.split(':')[0]
+                key_part = line.partition(':')[0]
                 if key_part.strip():
-                    expected_indent = indent_stack[-1]
+                    expected_indent = top
                     if actual_indent != expected_indent:
                         self._add_error(
                             i, actual_indent + 1, expected_indent + 1, actual_indent + 1,
-                            '.'.join(path_stack) if path_stack else 'root',
+                            path,
                             f"Key indentation mismatch: expected {expected_indent + 1}, found {actual_indent + 1}",
                             source
                         )
                     
                     # Value should be indented by indent_step
-                    indent_stack.append(expected_indent + self.indent_step)
+                    top = expected_indent + step
+                    add_level(top)
             else:
                 # Check if this line should be indented
-                if actual_indent > 0 and actual_indent not in indent_stack:
-                    # Find closest expected indentation
-                    closest_expected = min(indent_stack, key=lambda x: abs(x - actual_indent))
+                if actual_indent > 0 and actual_indent not in levels:
+                    # Find closest expected indentation; with evenly spaced
+                    # levels it is one of the two around actual_indent, and
+                    # the shallower one on a tie
+                    spaced = range(0, top + step, step) if step else range(1)
+                    last = len(spaced) - 1
+                    k = actual_indent // step if step else 0
+                    candidates = (spaced[min(max(k, 0), last)], spaced[min(max(k + 1, 0), last)])
+                    closest_expected = min(candidates, key=lambda x: abs(x - actual_indent))
                     if abs(actual_indent - closest_expected) > 0:
                         self._add_error(
                             i, actual_indent + 1, closest_expected + 1, actual_indent + 1,
-                            '.'.join(path_stack) if path_stack else 'root',
+                            path,
                             f"Indentation mismatch: expected {closest_expected + 1}, found {actual_indent + 1}",
                             source
                         )
@@ -272,16 +285,9 @@ class IndentationChecker:
     def _add_error(self, line: int, column: int, expected: int, actual: int,
                    path: str, message: str, source: str) -> None:
         """Add an indentation error to the list."""
-        error = IndentationError(
-            line=line,
-            column=column,
-            expected=expected,
-            actual=actual,
-            path=path,
-            message=message,
-            severity="error"
+        self.errors.append(
+            IndentationError(line, column, expected, actual, path, message, "error")
         )
-        self.errors.append(error)
     
     def fix_indentation(self, content: str, indent_step: Optional[int] = None) -> str:
         """
@@ -306,7 +312,6 @@ class IndentationChecker:
             # Parse and re-emit to normalize indentation
             data = yaml.load(content)
             
-            import io
             stream = io.StringIO()
             yaml.dump(data, stream)
             return stream.getvalue()
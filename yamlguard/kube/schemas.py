@@ -8,12 +8,29 @@ for different versions and resource types.
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin
 
 import requests
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data: bytes) -> Any:
+    """
+    Parse a JSON document from raw bytes.
+    
+    OpenAPI schemas run to several megabytes, so orjson is used when it is
+    installed; json.loads detects the UTF-8 encoding of bytes as well.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class KubernetesVersion(BaseModel):
     """Represents a Kubernetes version with schema information."""
@@ -58,6 +75,8 @@ class KubernetesSchemaManager:
         
         self.schemas: Dict[str, Dict[str, Any]] = {}
         self.versions: Dict[str, KubernetesVersion] = {}
+        # Resolved definitions keyed by (version, api_version, kind)
+        self._resource_schemas: Dict[Tuple[str, str, str], Optional[Dict[str, Any]]] = {}
         
         # Initialize with known stable versions
         self._initialize_versions()
@@ -102,21 +121,28 @@ class KubernetesSchemaManager:
         # Check cache first
         cache_file = self.cache_dir / f"k8s-schema-{normalized_version}.json"
         if cache_file.exists() and not force_refresh:
-            with open(cache_file, 'r') as f:
-                schema = json.load(f)
-                self.schemas[normalized_version] = schema
-                return schema
+            schema = _loads(cache_file.read_bytes())
+            self._set_schema(normalized_version, schema)
+            return schema
         
-        # Download schema
-        schema = self._download_schema(normalized_version)
+        # Download schema straight into the cache
+        self._download_schema(normalized_version, cache_file)
         
-        # Cache schema
-        with open(cache_file, 'w') as f:
-            json.dump(schema, f, indent=2)
+        try:
+            schema = _loads(cache_file.read_bytes())
+        except ValueError:
+            # Do not keep a body that is not JSON around as a cached schema
+            cache_file.unlink(missing_ok=True)
+            raise
         
-        self.schemas[normalized_version] = schema
+        self._set_schema(normalized_version, schema)
         return schema
     
+    def _set_schema(self, version: str, schema: Dict[str, Any]) -> None:
+        """Store a loaded schema, dropping resource lookups made against an older one."""
+        self.schemas[version] = schema
+        self._resource_schemas.clear()
+    
     def _normalize_version(self, version: str) -> str:
         """
         Normalize Kubernetes version string.
@@ -135,30 +161,43 @@ class KubernetesSchemaManager:
         else:
             raise ValueError(f"Invalid version format: {version}")
     
-    def _download_schema(self, version: str) -> Dict[str, Any]:
+    def _schema_urls(self, version: str) -> List[str]:
+        """Get the candidate schema sources for a version, in order of preference."""
+        return [
+            f"https://raw.githubusercontent.com/kubernetes/kubernetes/v{version}/api/openapi-spec/swagger.json",
+            f"https://raw.githubusercontent.com/kubernetes/kubernetes/v{version}/api/openapi-spec/v3/api/swagger.json",
+            f"https://raw.githubusercontent.com/kubernetes/kubernetes/v{version}/api/openapi-spec/v3/apis/swagger.json",
+        ]
+    
+    def _download_schema(self, version: str, cache_file: Path) -> None:
         """
-        Download Kubernetes schema from remote.
+        Download Kubernetes schema from remote into a cache file.
+        
+        The body is streamed to disk in chunks rather than held in memory,
+        and only replaces ``cache_file`` once it has been fully received.
         
         Args:
             version: Kubernetes version
-            
-        Returns:
-            Downloaded schema
+            cache_file: File to write the schema to
         """
-        # Try different schema sources
-        schema_urls = [
-            f"https://raw.githubusercontent.com/kubernetes/kubernetes/v{version}/api/openapi-spec/swagger.json",
-            f"https://raw.githubusercontent.com/kubernetes/kubernetes/v{version}/api/openapi-spec/v3/api/swagger.json",
-            f"https://raw.githubusercontent.com/kubernetes/kubernetes/v{version}/api/openapi-spec/v3/apis/swagger.json",
-        ]
+        # One file per writer, as pool workers may download the same schema at once
+        partial_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.part")
         
-        for url in schema_urls:
-            try:
-                response = requests.get(url, timeout=30)
-                response.raise_for_status()
-                return response.json()
-            except requests.RequestException:
-                continue
+        try:
+            # Try different schema sources
+            for url in self._schema_urls(version):
+                try:
+                    with requests.get(url, stream=True, timeout=30) as response:
+                        response.raise_for_status()
+                        with open(partial_file, 'wb') as f:
+                            for chunk in response.iter_content(chunk_size=1 << 16):
+                                f.write(chunk)
+                    os.replace(partial_file, cache_file)
+                    return
+                except requests.RequestException:
+                    continue
+        finally:
+            partial_file.unlink(missing_ok=True)
         
         raise RuntimeError(f"Failed to download schema for version {version}")
     
@@ -174,6 +213,10 @@ class KubernetesSchemaManager:
         Returns:
             Resource schema or None if not found
         """
+        key = (version, api_version, kind)
+        if key in self._resource_schemas:
+            return self._resource_schemas[key]
+        
         schema = self.get_schema(version)
         
         # Look for the resource in the schema
@@ -187,11 +230,14 @@ class KubernetesSchemaManager:
             kind,
         ]
         
+        resource_schema = None
         for resource_name in resource_names:
             if resource_name in definitions:
-                return definitions[resource_name]
+                resource_schema = definitions[resource_name]
+                break
         
-        return None
+        self._resource_schemas[key] = resource_schema
+        return resource_schema
     
     def list_available_versions(self) -> List[str]:
         """Get list of available Kubernetes versions."""
@@ -228,11 +274,15 @@ class KubernetesSchemaManager:
         Returns:
             True if version is available
         """
-        try:
-            self._download_schema(version)
-            return True
-        except RuntimeError:
-            return False
+        for url in self._schema_urls(version):
+            try:
+                response = requests.head(url, timeout=30, allow_redirects=True)
+                if response.ok:
+                    return True
+            except requests.RequestException:
+                continue
+        
+        return False
     
     def clear_cache(self) -> None:
         """Clear the schema cache."""
@@ -241,6 +291,7 @@ class KubernetesSchemaManager:
                 cache_file.unlink()
         
         self.schemas.clear()
+        self._resource_schemas.clear()
     
     def get_cache_info(self) -> Dict[str, Any]:
         """Get information about cached schemas."""
@@ -6,15 +6,19 @@ with support for both Python jsonschema and external kubeconform binary.
 """
 
 import json
+import os
+import re
 import subprocess
-import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import jsonschema
+import yaml
 from pydantic import BaseModel, Field
 
 from yamlguard.kube.schemas import KubernetesSchemaManager
+from yamlguard.loader import SafeDumper, SafeLoader, read_source
 
 
 class KubernetesValidationError(BaseModel):
@@ -28,6 +32,24 @@ class KubernetesValidationError(BaseModel):
     rule: str = Field(..., description="Validation rule that failed")
 
 
+# Document start marker at the beginning of a line
+_DOCUMENT_START = re.compile(r'^---(?=\s|$)', re.MULTILINE)
+
+# Validator of the current pool worker, set by _init_worker
+_worker_validator: Optional['KubernetesValidator'] = None
+
+
+def _init_worker(version: str, use_kubeconform: bool, strict: bool) -> None:
+    """Build the validator shared by all tasks in a pool worker."""
+    global _worker_validator
+    _worker_validator = KubernetesValidator(version, use_kubeconform, strict)
+
+
+def _validate_in_worker(file_path: Union[str, Path]) -> List[KubernetesValidationError]:
+    """Validate one file of a batch inside a pool worker."""
+    return _worker_validator._validate_batch_file(file_path)
+
+
 class KubernetesValidator:
     """
     Validates Kubernetes manifests against official schemas.
@@ -82,9 +104,8 @@ class KubernetesValidator:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            return self.validate_content(content, str(file_path))
+        content = read_source(file_path)
+        return self.validate_content(content, str(file_path))
     
     def validate_content(self, content: str, source: str = "<string>") -> List[KubernetesValidationError]:
         """
@@ -98,44 +119,64 @@ class KubernetesValidator:
             List of validation errors
         """
         errors = []
+        # Manifests validated together by a single kubeconform run
+        batch = []
+        use_kubeconform = self.use_kubeconform and self.kubeconform_available
         
         # Parse YAML documents
-        documents = self._parse_yaml_documents(content)
+        documents, complete = self._parse_yaml_documents(content)
         
         for doc_index, doc in enumerate(documents):
             if not self._is_kubernetes_manifest(doc):
                 continue
             
+            if use_kubeconform and doc.get('apiVersion') and doc.get('kind'):
+                batch.append(doc)
+                continue
+            
             # Validate each document
             doc_errors = self._validate_document(doc, source, doc_index)
             errors.extend(doc_errors)
         
+        if batch:
+            # Every document parsed and is in the batch, so kubeconform can read the source as is
+            raw = content if complete and len(batch) == len(documents) else None
+            errors.extend(self._validate_with_kubeconform(batch, source, raw))
+        
         return errors
     
-    def _parse_yaml_documents(self, content: str) -> List[Dict[str, Any]]:
-        """Parse YAML content into separate documents."""
-        from ruamel.yaml import YAML
+    def _parse_yaml_documents(self, content: str) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Parse YAML content into separate documents.
         
-        yaml = YAML()
-        documents = []
+        Returns:
+            The parsed documents, and whether the whole stream parsed; if not,
+            the documents that failed to parse were skipped
+        """
+        try:
+            documents = [doc for doc in yaml.load_all(content, Loader=SafeLoader)
+                         if doc is not None]
+            return documents, True
+        except yaml.YAMLError:
+            pass
         
-        # Split by document separators
-        parts = content.split('---')
+        # The stream has a broken document; parse the others one by one
+        documents = []
         
-        for part in parts:
+        for part in _DOCUMENT_START.split(content):
             part = part.strip()
             if not part:
                 continue
             
             try:
-                doc = yaml.load(part)
+                doc = yaml.load(part, Loader=SafeLoader)
                 if doc is not None:
                     documents.append(doc)
             except Exception:
                 # Skip invalid documents
                 continue
         
-        return documents
+        return documents, False
     
     def _is_kubernetes_manifest(self, doc: Dict[str, Any]) -> bool:
         """Check if a document is a Kubernetes manifest."""
@@ -168,7 +209,7 @@ class KubernetesValidator:
         
         # Use kubeconform if available and preferred
         if self.use_kubeconform and self.kubeconform_available:
-            kubeconform_errors = self._validate_with_kubeconform(doc, source, doc_index)
+            kubeconform_errors = self._validate_with_kubeconform([doc], source)
             errors.extend(kubeconform_errors)
         else:
             # Fall back to Python jsonschema validation
@@ -177,31 +218,42 @@ class KubernetesValidator:
         
         return errors
     
-    def _validate_with_kubeconform(self, doc: Dict[str, Any], source: str, 
-                                  doc_index: int) -> List[KubernetesValidationError]:
-        """Validate using kubeconform binary."""
+    def _validate_with_kubeconform(self, docs: List[Dict[str, Any]], source: str,
+                                  content: Optional[str] = None) -> List[KubernetesValidationError]:
+        """
+        Validate documents using the kubeconform binary.
+        
+        All documents are piped to a single kubeconform process on stdin,
+        so a manifest file costs one process however many documents it has.
+        
+        Args:
+            docs: Parsed documents to validate
+            source: Source identifier for error reporting
+            content: Original YAML holding exactly ``docs``; sent as is
+                instead of serializing ``docs`` again
+        """
         errors = []
         
+        if content is None:
+            content = yaml.dump_all(docs, Dumper=SafeDumper, default_flow_style=False)
+        
         try:
-            # Write document to temporary file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-                import yaml
-                yaml.dump(doc, f, default_flow_style=False)
-                temp_file = f.name
-            
-            # Run kubeconform
+            # Run kubeconform on stdin
             cmd = [
                 'kubeconform',
                 '-kubernetes-version', self.version,
-                '-output', 'json',
-                temp_file
+                '-output', 'json'
             ]
             
             if self.strict:
                 cmd.append('-strict')
             
+            # Flags must precede the input, which '-' reads from stdin
+            cmd.append('-')
+            
             result = subprocess.run(
                 cmd,
+                input=content,
                 capture_output=True,
                 text=True,
                 timeout=30
@@ -232,9 +284,6 @@ class KubernetesValidator:
                         rule="kubeconform-error"
                     ))
             
-            # Clean up temporary file
-            Path(temp_file).unlink()
-            
         except subprocess.TimeoutExpired:
             errors.append(KubernetesValidationError(
                 line=1,
@@ -304,34 +353,54 @@ class KubernetesValidator:
         
         return errors
     
-    def validate_batch(self, file_paths: List[Union[str, Path]]) -> Dict[str, List[KubernetesValidationError]]:
+    def validate_batch(self, file_paths: List[Union[str, Path]],
+                       jobs: int = 1) -> Dict[str, List[KubernetesValidationError]]:
         """
         Validate multiple files in batch.
         
+        Files are validated serially unless ``jobs`` asks for more workers.
+        jsonschema validation is pure Python, so it then spreads files over
+        worker processes, each loading the schema once; kubeconform runs as
+        a subprocess per file and only needs threads to overlap.
+        
         Args:
             file_paths: List of file paths to validate
+            jobs: Number of workers (1 = validate serially, 0 = one per CPU)
             
         Returns:
             Dictionary mapping file paths to validation errors
         """
-        results = {}
+        workers = min(jobs or os.cpu_count() or 1, len(file_paths))
         
-        for file_path in file_paths:
-            try:
-                errors = self.validate_file(file_path)
-                results[str(file_path)] = errors
-            except Exception as e:
-                # Add error for file processing failure
-                results[str(file_path)] = [KubernetesValidationError(
-                    line=1,
-                    column=1,
-                    path="",
-                    message=f"Failed to process file: {str(e)}",
-                    severity="error",
-                    rule="file-error"
-                )]
+        if workers <= 1:
+            errors = [self._validate_batch_file(file_path) for file_path in file_paths]
+        elif self.use_kubeconform and self.kubeconform_available:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                errors = list(executor.map(self._validate_batch_file, file_paths))
+        else:
+            # A few chunks per worker keeps IPC low while still balancing load
+            chunksize = max(1, len(file_paths) // (4 * workers))
+            
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(self.version, self.use_kubeconform, self.strict)) as executor:
+                errors = list(executor.map(_validate_in_worker, file_paths, chunksize=chunksize))
         
-        return results
+        return {str(file_path): file_errors for file_path, file_errors in zip(file_paths, errors)}
+    
+    def _validate_batch_file(self, file_path: Union[str, Path]) -> List[KubernetesValidationError]:
+        """Validate one file of a batch, reporting failures as a file-error."""
+        try:
+            return self.validate_file(file_path)
+        except Exception as e:
+            # Add error for file processing failure
+            return [KubernetesValidationError(
+                line=1,
+                column=1,
+                path="",
+                message=f"Failed to process file: {str(e)}",
+                severity="error",
+                rule="file-error"
+            )]
     
     def get_supported_versions(self) -> List[str]:
         """Get list of supported Kubernetes versions."""
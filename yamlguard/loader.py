@@ -6,13 +6,54 @@ for indentation validation.
 """
 
 import io
+import mmap
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+import yaml
 from ruamel.yaml import YAML, YAMLError
 from ruamel.yaml.comments import CommentedMap, CommentedSeq
 from ruamel.yaml.tokens import Token
 
+try:
+    # LibYAML bindings, available when PyYAML was built against libyaml
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+# Files at least this large are decoded from a memory map instead of read()
+MMAP_THRESHOLD = 64 * 1024
+
+
+def read_source(file_path: Union[str, Path]) -> str:
+    """
+    Read a UTF-8 YAML file with universal newlines.
+    
+    Large files are decoded straight from a read-only memory map, which
+    skips the intermediate buffer copy of a text-mode read(). Small files
+    use a plain read since mapping costs more than it saves for them.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        File content
+    """
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            content = f.read().decode('utf-8')
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = str(mm, 'utf-8')
+    
+    if '\r' in content:
+        # Match the newline translation of text-mode reads
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    
+    return content
+
 
 class YAMLLoader:
     """
@@ -160,21 +201,22 @@ class YAMLLoader:
     
     def _get_key_position(self, mapping: CommentedMap, key: str) -> Optional[Dict[str, int]]:
         """Get position information for a mapping key."""
-        if not hasattr(mapping, 'ca') or not mapping.ca:
+        # ruamel.yaml records 0-based (line, column) of every key as it composes
+        try:
+            line, column = mapping.lc.key(key)
+        except (AttributeError, KeyError, TypeError):
             return None
         
-        # This is a simplified implementation
-        # In practice, you'd need to parse the comment attributes more carefully
-        return {'line': 1, 'column': 1}  # Placeholder
+        return {'line': line + 1, 'column': column + 1}
     
     def _get_item_position(self, sequence: CommentedSeq, index: int) -> Optional[Dict[str, int]]:
         """Get position information for a sequence item."""
-        if not hasattr(sequence, 'ca') or not sequence.ca:
+        try:
+            line, column = sequence.lc.item(index)
+        except (AttributeError, KeyError, TypeError):
             return None
         
-        # This is a simplified implementation
-        # In practice, you'd need to parse the comment attributes more carefully
-        return {'line': 1, 'column': 1}  # Placeholder
+        return {'line': line + 1, 'column': column + 1}
     
     def dump(self, data: Any, stream: Optional[io.StringIO] = None) -> str:
         """
@@ -224,11 +266,7 @@ class SafeYAMLLoader:
     
     def __init__(self):
         """Initialize the safe YAML loader."""
-        try:
-            import yaml
-            self.yaml = yaml
-        except ImportError:
-            raise ImportError("PyYAML is required for SafeYAMLLoader")
+        self.yaml = yaml
     
     def load_file(self, file_path: Union[str, Path]) -> Tuple[Any, List[Dict[str, Any]]]:
         """
@@ -246,7 +284,7 @@ class SafeYAMLLoader:
             raise FileNotFoundError(f"File not found: {file_path}")
         
         with open(file_path, 'r', encoding='utf-8') as f:
-            data = self.yaml.safe_load(f)
+            data = self.yaml.load(f, Loader=SafeLoader)
             return data, []  # No position info with PyYAML
     
     def load_stream(self, stream: Union[str, io.StringIO], source: str = "<string>") -> Tuple[Any, List[Dict[str, Any]]]:
@@ -264,5 +302,5 @@ class SafeYAMLLoader:
             stream = io.StringIO(stream)
         
         stream.seek(0)
-        data = self.yaml.safe_load(stream)
+        data = self.yaml.load(stream, Loader=SafeLoader)
         return data, []  # No position info with PyYAML
@@ -6,7 +6,6 @@ stylish (eslint-like), JSON, and JSONL formats.
 """
 
 from yamlguard.reporters.base import Reporter
-from yamlguard.reporters.stylish import StylishReporter
 from yamlguard.reporters.jsonl import JSONLReporter
 
 __all__ = [
@@ -14,3 +13,11 @@ __all__ = [
     "StylishReporter",
     "JSONLReporter",
 ]
+
+
+def __getattr__(name: str):
+    """Import the stylish reporter on first access; it pulls in rich."""
+    if name == "StylishReporter":
+        from yamlguard.reporters.stylish import StylishReporter
+        return StylishReporter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
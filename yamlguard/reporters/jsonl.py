@@ -6,10 +6,42 @@ and integration with CI/CD pipelines.
 """
 
 import json
-from typing import List
+import re
+from typing import Any, Iterator, List, TextIO
 
 from yamlguard.reporters.base import Reporter, ValidationResult
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Characters json.dumps escapes by default but orjson writes as is
+_NON_ASCII = re.compile(r'[^\x00-\x7e]')
+
+
+def _escape_non_ascii(match: 're.Match[str]') -> str:
+    """Escape one character as \\uXXXX, using a surrogate pair beyond the BMP."""
+    code = ord(match.group())
+    if code > 0xFFFF:
+        code -= 0x10000
+        return '\\u%04x\\u%04x' % (0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF))
+    return '\\u%04x' % code
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Serialize a record as one line of compact, ASCII-only JSON.
+    
+    Uses orjson when it is installed, escaping its UTF-8 output the way
+    the standard library fallback does, so both produce the same text and
+    reports print on terminals without a UTF-8 locale.
+    """
+    if orjson is not None:
+        return _NON_ASCII.sub(_escape_non_ascii, orjson.dumps(obj).decode())
+    return json.dumps(obj, separators=(',', ':'))
+
 
 class JSONLReporter(Reporter):
     """
@@ -39,15 +71,39 @@ class JSONLReporter(Reporter):
         Returns:
             JSONL formatted report string
         """
+        return "\n".join(self.iter_lines(results))
+    
+    def write(self, results: List[ValidationResult], stream: TextIO) -> None:
+        """
+        Write a JSONL report to a stream one record at a time.
+        
+        Unlike report(), the full report is never held in memory as a
+        single string.
+        
+        Args:
+            results: List of validation results
+            stream: Text stream to write to
+        """
+        for line in self.iter_lines(results):
+            stream.write(line)
+            stream.write("\n")
+    
+    def iter_lines(self, results: List[ValidationResult]) -> Iterator[str]:
+        """
+        Generate the lines of a JSONL report.
+        
+        Args:
+            results: List of validation results
+            
+        Yields:
+            One JSON record per line: the summary, then each file with issues
+        """
         if not results:
-            return ""
+            return
         
         # Get summary statistics
         summary = self._get_summary(results)
         
-        # Generate JSONL output
-        lines = []
-        
         # Add summary line
         summary_line = {
             "type": "summary",
@@ -58,7 +114,7 @@ class JSONLReporter(Reporter):
             "success": summary['success'],
             "total_issues": summary['errors'] + summary['warnings'] + summary['info']
         }
-        lines.append(json.dumps(summary_line))
+        yield _dumps(summary_line)
         
         # Add file results
         for result in results:
@@ -72,9 +128,7 @@ class JSONLReporter(Reporter):
                     "warnings": result.get('warnings', []),
                     "info": result.get('info', [])
                 }
-                lines.append(json.dumps(file_line))
-        
-        return "\n".join(lines)
+                yield _dumps(file_line)
     
     def report_file(self, file_path: str, errors: List[dict]) -> str:
         """
@@ -100,7 +154,7 @@ class JSONLReporter(Reporter):
             "info": categorized['info']
         }
         
-        return json.dumps(file_result)
+        return _dumps(file_result)
     
     def report_error(self, error: dict) -> str:
         """
@@ -124,7 +178,7 @@ class JSONLReporter(Reporter):
             "context": error.get('context', '')
         }
         
-        return json.dumps(error_line)
+        return _dumps(error_line)
     
     def report_summary(self, results: List[ValidationResult]) -> str:
         """
@@ -148,7 +202,7 @@ class JSONLReporter(Reporter):
             "total_issues": summary['errors'] + summary['warnings'] + summary['info']
         }
         
-        return json.dumps(summary_line)
+        return _dumps(summary_line)
     
     def report_compact(self, results: List[ValidationResult]) -> str:
         """
@@ -175,7 +229,7 @@ class JSONLReporter(Reporter):
                     "info": len(result.get('info', [])),
                     "success": result.get('success', True)
                 }
-                lines.append(json.dumps(compact_line))
+                lines.append(_dumps(compact_line))
         
         return "\n".join(lines)
     
@@ -205,7 +259,7 @@ class JSONLReporter(Reporter):
             "success": summary['success'],
             "total_issues": summary['errors'] + summary['warnings'] + summary['info']
         }
-        lines.append(json.dumps(summary_line))
+        lines.append(_dumps(summary_line))
         
         # Add detailed file results
         for result in results:
@@ -217,7 +271,7 @@ class JSONLReporter(Reporter):
                     "success": result.success,
                     "duration": result.duration
                 }
-                lines.append(json.dumps(file_header))
+                lines.append(_dumps(file_header))
                 
                 # Add individual errors
                 for error in result.get('errors', []):
@@ -232,7 +286,7 @@ class JSONLReporter(Reporter):
                         "path": error.get('path', ''),
                         "context": error.get('context', '')
                     }
-                    lines.append(json.dumps(error_line))
+                    lines.append(_dumps(error_line))
                 
                 # Add individual warnings
                 for warning in result.warnings:
@@ -247,7 +301,7 @@ class JSONLReporter(Reporter):
                         "path": warning.get('path', ''),
                         "context": warning.get('context', '')
                     }
-                    lines.append(json.dumps(warning_line))
+                    lines.append(_dumps(warning_line))
                 
                 # Add individual info messages
                 for info in result.info:
@@ -262,6 +316,6 @@ class JSONLReporter(Reporter):
                         "path": info.get('path', ''),
                         "context": info.get('context', '')
                     }
-                    lines.append(json.dumps(info_line))
+                    lines.append(_dumps(info_line))
         
         return "\n".join(lines)
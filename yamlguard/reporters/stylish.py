@@ -5,7 +5,7 @@ Provides eslint/yamllint-like output formatting with colors and detailed
 error information including line numbers and context.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from rich.console import Console
 from rich.panel import Panel
@@ -15,6 +15,16 @@ from rich.text import Text
 from yamlguard.reporters.base import Reporter, ValidationResult
 
 
+# Result list and indicator for each severity, in display order
+_SEVERITY_SECTIONS = (
+    ("error", "errors", "❌"),
+    ("warning", "warnings", "⚠️ "),
+    ("info", "info", "ℹ️ "),
+)
+
+_SEVERITY_INDICATORS = {severity: indicator for severity, _, indicator in _SEVERITY_SECTIONS}
+
+
 class StylishReporter(Reporter):
     """
     Stylish reporter with eslint/yamllint-like output.
@@ -107,21 +117,16 @@ class StylishReporter(Reporter):
         file_path = result.get('file_path', 'unknown')
         lines.append(f"\n📄 {file_path}")
         
-        # Add errors
-        for error in result.get('errors', []):
-            lines.append(self._format_error_line(error, "error"))
-        
-        # Add warnings
-        for warning in result.get('warnings', []):
-            lines.append(self._format_error_line(warning, "warning"))
-        
-        # Add info messages
-        for info in result.get('info', []):
-            lines.append(self._format_error_line(info, "info"))
+        # Add errors, warnings and info messages, resolving each
+        # severity's indicator once rather than per finding
+        for _, key, indicator in _SEVERITY_SECTIONS:
+            for error in result.get(key, []):
+                lines.append(self._format_error_line(error, indicator=indicator))
         
         return "\n".join(lines)
     
-    def _format_error_line(self, error: dict, severity: str) -> str:
+    def _format_error_line(self, error: dict, severity: str = "error",
+                           indicator: Optional[str] = None) -> str:
         """Format a single error line."""
         line = error.get('line', 0)
         column = error.get('column', 0)
@@ -129,12 +134,8 @@ class StylishReporter(Reporter):
         rule = error.get('rule', 'unknown')
         
         # Severity indicator
-        if severity == "error":
-            indicator = "❌"
-        elif severity == "warning":
-            indicator = "⚠️ "
-        else:
-            indicator = "ℹ️ "
+        if indicator is None:
+            indicator = _SEVERITY_INDICATORS.get(severity, "ℹ️ ")
         
         # Position information
         if line > 0 and column > 0:
@@ -13,6 +13,7 @@ from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field
 
+from yamlguard.loader import read_source
 from yamlguard.secrets.rules import SecretMatch
 
 
@@ -65,9 +66,8 @@ class GitleaksAdapter:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            return self.scan_content(content, str(file_path))
+        content = read_source(file_path)
+        return self.scan_content(content, str(file_path))
     
     def scan_content(self, content: str, source: str = "<string>") -> List[SecretMatch]:
         """
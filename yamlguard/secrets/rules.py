@@ -7,11 +7,90 @@ Shannon entropy analysis, and context-aware heuristics for YAML files.
 
 import math
 import re
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Pattern, Set, Tuple, Union
 
 from pydantic import BaseModel, Field
 
+from yamlguard.loader import read_source
+
+
+# Heuristics checked against every candidate line, compiled once at import
+_FALSE_POSITIVE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'example\.com',
+        r'localhost',
+        r'127\.0\.0\.1',
+        r'placeholder',
+        r'test',
+        r'dummy',
+        r'sample',
+    )
+)
+
+_ALLOWLIST_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'# yamlguard:allow',
+        r'# yamlguard:ignore',
+    )
+)
+
+# Group references by number (\1, (?(1)...)), which shift once patterns are
+# joined into one alternation
+_NUMBERED_GROUP_REFERENCE = re.compile(r'\\[1-9]|\(\?\(\d')
+
+
+@lru_cache(maxsize=None)
+def _compile_rule_pattern(pattern: str) -> Pattern:
+    """
+    Compile a rule pattern once per process.
+    
+    An engine is built for every YAMLGuard instance and pool worker, so
+    they all share the same compiled patterns instead of recompiling them.
+    
+    Args:
+        pattern: Regex pattern
+        
+    Returns:
+        Compiled case-insensitive pattern
+    """
+    return re.compile(pattern, re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _shannon_entropy(text: str) -> float:
+    """
+    Calculate Shannon entropy of a string.
+    
+    Memoized because overlapping rules (e.g. aws-secret-key and api-key)
+    match, and therefore score, the same candidate strings.
+    
+    Args:
+        text: Text to analyze
+        
+    Returns:
+        Entropy value
+    """
+    if not text:
+        return 0.0
+    
+    # Count character frequencies (Counter tallies in C, not per character)
+    char_counts = Counter(text)
+    
+    # Calculate entropy
+    entropy = 0.0
+    text_len = len(text)
+    
+    for count in char_counts.values():
+        probability = count / text_len
+        entropy -= probability * math.log2(probability)
+    
+    return entropy
+
 
 class SecretMatch(BaseModel):
     """Represents a detected secret with detailed information."""
@@ -55,6 +134,7 @@ class SecretsRuleEngine:
         self.entropy_threshold = entropy_threshold
         self.rules = self._initialize_rules()
         self.compiled_patterns: Dict[str, Pattern] = {}
+        self.prefilter: Optional[Pattern] = None
         self._compile_patterns()
     
     def _initialize_rules(self) -> List[SecretRule]:
@@ -184,9 +264,36 @@ class SecretsRuleEngine:
         """Compile regex patterns for performance."""
         for rule in self.rules:
             try:
-                self.compiled_patterns[rule.name] = re.compile(rule.pattern, re.IGNORECASE)
+                self.compiled_patterns[rule.name] = _compile_rule_pattern(rule.pattern)
             except re.error as e:
                 print(f"Warning: Invalid regex pattern for rule {rule.name}: {e}")
+        self._build_prefilter()
+    
+    def _build_prefilter(self) -> None:
+        """
+        Combine all rule patterns into a single alternation.
+        
+        A line that doesn't match the combined pattern can't match any
+        individual rule, so scan_content can reject it with one regex pass
+        instead of one pass per rule. Capturing groups are harmless in a
+        match/no-match test, but a backreference by number would point at
+        a different group once patterns are joined, so the prefilter is
+        disabled when any rule uses one.
+        """
+        patterns = [self.compiled_patterns[rule.name] for rule in self.rules
+                    if rule.name in self.compiled_patterns]
+        self.prefilter = None
+        if not patterns or any(_NUMBERED_GROUP_REFERENCE.search(pattern.pattern)
+                               for pattern in patterns):
+            return
+        
+        try:
+            self.prefilter = _compile_rule_pattern(
+                '|'.join(f'(?:{pattern.pattern})' for pattern in patterns)
+            )
+        except re.error:
+            # Inline flags and the like can't always be combined
+            self.prefilter = None
     
     def scan_file(self, file_path: Union[str, Path]) -> List[SecretMatch]:
         """
@@ -203,9 +310,8 @@ class SecretsRuleEngine:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            return self.scan_content(content, str(file_path))
+        content = read_source(file_path)
+        return self.scan_content(content, str(file_path))
     
     def scan_content(self, content: str, source: str = "<string>") -> List[SecretMatch]:
         """
@@ -220,8 +326,13 @@ class SecretsRuleEngine:
         """
         matches = []
         lines = content.splitlines()
+        prefilter = self.prefilter
         
         for line_num, line in enumerate(lines, 1):
+            # Skip lines that no rule can match
+            if prefilter is not None and not prefilter.search(line):
+                continue
+            
             # Check each rule
             for rule in self.rules:
                 pattern = self.compiled_patterns.get(rule.name)
@@ -289,28 +400,13 @@ class SecretsRuleEngine:
             confidence += 0.1 * context_matches
         
         # Check for common false positives
-        false_positive_patterns = [
-            r'example\.com',
-            r'localhost',
-            r'127\.0\.0\.1',
-            r'placeholder',
-            r'test',
-            r'dummy',
-            r'sample',
-        ]
-        
-        for pattern in false_positive_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
+        for pattern in _FALSE_POSITIVE_PATTERNS:
+            if pattern.search(line):
                 confidence *= 0.3  # Reduce confidence for likely false positives
         
         # Check for allowlist patterns
-        allowlist_patterns = [
-            r'# yamlguard:allow',
-            r'# yamlguard:ignore',
-        ]
-        
-        for pattern in allowlist_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
+        for pattern in _ALLOWLIST_PATTERNS:
+            if pattern.search(line):
                 return 0.0  # Explicitly allowed
         
         return min(confidence, 1.0)
@@ -325,24 +421,7 @@ class SecretsRuleEngine:
         Returns:
             Entropy value
         """
-        if not text:
-            return 0.0
-        
-        # Count character frequencies
-        char_counts = {}
-        for char in text:
-            char_counts[char] = char_counts.get(char, 0) + 1
-        
-        # Calculate entropy
-        entropy = 0.0
-        text_len = len(text)
-        
-        for count in char_counts.values():
-            probability = count / text_len
-            if probability > 0:
-                entropy -= probability * math.log2(probability)
-        
-        return entropy
+        return _shannon_entropy(text)
     
     def _get_context(self, lines: List[str], line_num: int, start: int, end: int) -> str:
         """
@@ -401,9 +480,10 @@ class SecretsRuleEngine:
         """
         self.rules.append(rule)
         try:
-            self.compiled_patterns[rule.name] = re.compile(rule.pattern, re.IGNORECASE)
+            self.compiled_patterns[rule.name] = _compile_rule_pattern(rule.pattern)
         except re.error as e:
             raise ValueError(f"Invalid regex pattern: {e}")
+        self._build_prefilter()
     
     def get_rule_info(self) -> List[Dict[str, Any]]:
         """Get information about all rules."""